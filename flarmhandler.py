@@ -5,9 +5,14 @@ Fluthin Armadillo Store handler (PyQt5 + Markdown + Custom Titlebar + Orange The
 """
 
 from __future__ import annotations
-import sys, os, platform, tempfile, shutil, zipfile, tarfile, re, json, webbrowser, subprocess, requests, time, ctypes
+import sys, os, io, platform, tempfile, shutil, zipfile, tarfile, re, json, webbrowser, subprocess, requests, time, ctypes, functools, atexit, threading, errno, stat, hashlib
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyQt5 import QtWidgets, QtGui, QtCore, QtSvg
 
 # --- Try to import PyQt5-Markdown widgets ---
@@ -18,6 +23,17 @@ try:
 except Exception:
     HAS_MARKDOWN = False
 
+README_STYLE = "<style>body { font-family: Roboto, sans-serif; color: #202124; line-height: 1.6; } a { color: #ff6d00; text-decoration: none; } code { background: #f1f3f4; padding: 2px 4px; border-radius: 4px; } h1, h2, h3 { color: #202124; }</style>"
+# One reusable converter per thread: READMEs are rendered on the fetch workers
+_MD_LOCAL = threading.local()
+
+def render_readme_html(text: str) -> str:
+    """README markdown as the styled HTML shown in readme_view. Safe to call off the GUI thread."""
+    md = getattr(_MD_LOCAL, 'md', None)
+    if md is None:
+        md = _MD_LOCAL.md = markdown.Markdown()
+    return README_STYLE + md.reset().convert(text)
+
 # --- Custom titlebar button icons (Windows 11 Style SVGs) ---
 WIN11_ICONS = {
     "close": "M 10.5 10.5 L 21.5 21.5 M 21.5 10.5 L 10.5 21.5", # Thin X
@@ -27,27 +43,86 @@ WIN11_ICONS = {
 }
 
 # Optional Windows helpers
-HAS_PYWIN32 = False
 try:
     import winreg
 except Exception:
     winreg = None
-try:
-    import pythoncom
-    import win32com.client  # type: ignore
-    HAS_PYWIN32 = True
-except Exception:
-    HAS_PYWIN32 = False
+
+@functools.lru_cache(maxsize=1)
+def _pywin32():
+    """(pythoncom, win32com.client), or None without pywin32. Imported on first use: loading the
+    COM machinery is slow and only shortcut creation needs it."""
+    try:
+        import pythoncom
+        import win32com.client  # type: ignore
+    except Exception:
+        return None
+    return pythoncom, win32com.client
 
 DEFAULT_SPLASH = "assets/splash.png"
 DEFAULT_ICON = "assets/product_logo.png"
 SPLASH_SETUP = "assets/splash_setup.png"
 
 GITHUB_RAW_TEMPLATE = "https://raw.githubusercontent.com/{owner}/{repo}/main/assets/splash.png"
+GITHUB_RAW_ROOT = "https://raw.githubusercontent.com/"
 GITHUB_RELEASES_API = "https://api.github.com/repos/{owner}/{repo}/releases"
 SCHEME = "Fluthinstore"
 MIMETYPE = "application/x-Fluthinstore"
 
+# Package file names: {app}-{version}-{platform}.iflapp
+# Characters Windows refuses in shortcut file names (deletion table for str.translate)
+_SHORTCUT_FORBIDDEN = frozenset('<>:"/\\|?*')
+_SHORTCUT_TRANSLATE = str.maketrans('', '', '<>:"/\\|?*')
+
+def sanitize_shortcut_name(name: str) -> str:
+    # Most app names are already clean; only build a new string when needed
+    if _SHORTCUT_FORBIDDEN.isdisjoint(name):
+        return name
+    return name.translate(_SHORTCUT_TRANSLATE)
+
+# Platform tag -> prefixes accepted for a token of an asset's platform part
+_ALIASES = {
+    'knosthalij': ('knosthalij', 'windows', 'win'),
+    'danenone': ('danenone', 'linux', 'mac', 'macos', 'darwin')
+}
+_PLATFORM_TOKEN_SPLIT_RE = re.compile(r'[-_.]+')
+# Quoted paths in a registered shell\open\command value
+_CMD_SCRIPT_RE = re.compile(r'"([^"]+)"\s+"([^"]+)"')
+_CMD_EXE_RE = re.compile(r'"([^"]+)"')
+
+# Directories never worth descending into when looking for an app's executable
+_SCAN_SKIP_DIRS = frozenset({'__pycache__', '.git', '.svn', '.hg', 'node_modules'})
+
+# --- Shared HTTP session ---
+# One pooled keep-alive session for every GitHub request, so consecutive calls
+# (details.xml, releases API, asset download) reuse the same TLS connection.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "flarmhandler", "Accept-Encoding": "gzip, deflate"})
+# pool_maxsize covers the _FETCH_POOL workers plus the IOWorkers and InstallWorker that
+# request at the same time; a smaller pool would drop their keep-alive sockets on return.
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=16,
+    # raise_on_status=False: once the retries run out the last response is returned, so callers
+    # still see r.ok / r.status_code instead of a RetryError
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)))
+
+def get_session() -> requests.Session:
+    """The shared session every HTTP call goes through (swap its adapters to stub the network)."""
+    return _SESSION
+
+# Small pool used to fan out independent GET requests (bounded to stay polite with GitHub)
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="flarm-fetch")
+
+def fetch_all(urls: list[str], timeout: float = 6) -> list[requests.Response | None]:
+    """GETs all urls concurrently on the shared session. Failed requests come back as None, in input order."""
+    def _get(url):
+        try:
+            return _SESSION.get(url, timeout=timeout)
+        except Exception:
+            return None
+    return list(_FETCH_POOL.map(_get, urls))
+
 # --- Global QSS (Orange Theme) ---
 GLOBAL_QSS = """
 /* Global Reset */
@@ -225,6 +300,11 @@ QLineEdit:focus, QTextEdit:focus {
 }
 """
 
+# Minified copy handed to Qt: no comments, whitespace collapsed
+_GLOBAL_QSS_MIN = re.sub(r'/\*.*?\*/', '', GLOBAL_QSS, flags=re.S)
+_GLOBAL_QSS_MIN = re.sub(r'\s*([{}:;,])\s*', r'\1', re.sub(r'\s+', ' ', _GLOBAL_QSS_MIN)).strip()
+
+@functools.lru_cache(maxsize=1)
 def is_admin():
     try:
         return ctypes.windll.shell32.IsUserAnAdmin()
@@ -250,19 +330,23 @@ def run_as_admin(argv=None):
     ret = ctypes.windll.shell32.ShellExecuteW(None, "runas", executable, argument_line, None, 1)
     return int(ret) > 32
 
+# The host platform never changes during the process, so resolve it once
+_SYSPLAT = platform.system().lower()
+_IS_WINDOWS = sys.platform.startswith("win")
+_PLATFORM_TAG = 'Knosthalij' if ('windows' in _SYSPLAT or 'win' in _SYSPLAT) else 'Danenone'
+
 def platform_tag() -> str:
-    sysplat = platform.system().lower()
-    if 'windows' in sysplat or 'win' in sysplat:
-        return 'Knosthalij'
-    return 'Danenone'
+    return _PLATFORM_TAG
 
+@functools.lru_cache(maxsize=32)
 def check_platform_compatibility(target_platform: str) -> tuple[bool, str]:
     """
     Checks if the target platform (from details.xml) is compatible with the current OS.
     Returns (is_compatible, error_message).
     """
     current_os_tag = platform_tag()
-    target = target_platform.lower() if target_platform else ""
+    # casefold, not lower: the tag comes from a user-authored details.xml
+    target = target_platform.casefold() if target_platform else ""
     
     # If target is empty, we assume it's universal or unknown, so we allow it (or maybe warn?)
     # For now, let's be permissive if unknown, but strict if known.
@@ -282,9 +366,12 @@ def check_platform_compatibility(target_platform: str) -> tuple[bool, str]:
 def parse_Fluthin_url(url: str) -> tuple[str, str]:
     if not url:
         raise ValueError("No URL provided")
-    clean_url = url.replace(f"{SCHEME}://", "").replace(f"{SCHEME}:", "")
-    if clean_url.endswith('/'):
-        clean_url = clean_url[:-1]
+    # Plain startswith/slicing: str.removeprefix needs Python 3.9
+    clean_url = url
+    for prefix in (f"{SCHEME}://", f"{SCHEME}:"):
+        if clean_url.startswith(prefix):
+            clean_url = clean_url[len(prefix):]
+    clean_url = clean_url.rstrip('/')
     parts = clean_url.split('.')
     if len(parts) >= 2:
         owner = parts[0]
@@ -296,61 +383,336 @@ def parse_Fluthin_url(url: str) -> tuple[str, str]:
 def platform_system_tag_for_asset() -> str:
     return platform_tag()
 
+# What [0-9A-Za-z._-] matches under re.IGNORECASE, which also folds in U+0130, U+0131, U+017F
+# and U+212A; the dotted and dotless i likewise count as 'i' in the suffix
+_IFLAPP_SEGMENT_CHARS = frozenset('0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.-_'
+                                  '\u0130\u0131\u017f\u212a')
+_IFLAPP_SUFFIX_FOLD = str.maketrans('\u0130\u0131', 'ii')
+
+def _parse_iflapp(name: str) -> tuple[str, str, str] | None:
+    r"""Splits '{app}-{version}-{platform}.iflapp' into its three parts, or returns None.
+    Implements r'^(.+?)-([0-9A-Za-z\.\-_]+)-([0-9A-Za-z\._\-]+)\.iflapp$' (re.IGNORECASE) with str
+    methods: the app is the shortest prefix that leaves a valid '{version}-{platform}', and the
+    version takes every '-' but the last usable one. Remote assets and local packages both use it."""
+    if name.endswith('\n'):
+        name = name[:-1]  # '$' also matches before a trailing newline
+    if name[-7:].translate(_IFLAPP_SUFFIX_FOLD).lower() != '.iflapp':
+        return None
+    stem = name[:-7]
+    i = stem.find('-', 1)
+    while i != -1:
+        app, rest = stem[:i], stem[i + 1:]
+        if '\n' in app:
+            return None  # '.' never matches a newline, and the app only grows from here
+        if _IFLAPP_SEGMENT_CHARS.issuperset(rest):
+            j = rest.rfind('-', 1, len(rest) - 1)
+            if j != -1:
+                return app, rest[:j], rest[j + 1:]
+        i = stem.find('-', i + 1)
+    return None
+
 def best_asset_for_platform(assets: list, shortname: str) -> tuple[dict | None, str | None, str | None]:
     plat = platform_system_tag_for_asset().lower()
-    aliases = {
-        'knosthalij': ['knosthalij', 'windows', 'win'],
-        'danenone': ['danenone', 'linux', 'mac', 'macos', 'darwin']
-    }
-    
-    def match_name(name: str) -> bool:
-        if not name.lower().endswith('.iflapp'):
-            return False
-        m = re.match(r'^(.+?)-([0-9A-Za-z\.\-_]+)-([0-9A-Za-z\._\-]+)\.iflapp$', name, re.IGNORECASE)
-        if not m:
-            return False
-        platpart = m.group(3).lower()
-        for key, vals in aliases.items():
-            if plat in [key] and any(v in platpart for v in vals):
-                return True
-        return False
+    plat_aliases = _ALIASES.get(plat, ())
+    short_prefix = shortname.lower() + '-'
+    prefix_len = len(short_prefix)
 
-    for a in assets:
-        if match_name(a.get('name','')):
-            m = re.match(r'^(.+?)-([0-9A-Za-z\.\-_]+)-([0-9A-Za-z\._\-]+)\.iflapp$', a.get('name',''), re.IGNORECASE)
-            if m:
-                return a, m.group(2), m.group(3)
-    
+    # One pass: a platform match wins at once, the first asset named after the
+    # app is kept as the fallback. _parse_iflapp already checks the '.iflapp' suffix.
+    fallback = None
     for a in assets:
         name = a.get('name','')
-        if name.lower().endswith('.iflapp') and name.lower().startswith(shortname.lower() + '-'):
-             m = re.match(r'^(.+?)-([0-9A-Za-z\.\-_]+)-([0-9A-Za-z\._\-]+)\.iflapp$', name, re.IGNORECASE)
-             if m:
-                 return a, m.group(2), m.group(3)
-                 
-    return None, None, None
-
-def download_file(url: str, dest_path: str, progress_callback=None) -> str:
-    with requests.get(url, stream=True, timeout=30) as r:
+        parts = _parse_iflapp(name)
+        if not parts:
+            continue
+        _, version, plat_part = parts
+        # Token prefixes: 'win64' and 'linux64' still match, but 'darwin' is not taken for 'win'
+        tokens = _PLATFORM_TOKEN_SPLIT_RE.split(plat_part.lower())
+        if any(tok.startswith(plat_aliases) for tok in tokens):
+            return a, version, plat_part
+        if fallback is None and name[:prefix_len].lower() == short_prefix:
+            fallback = (a, version, plat_part)
+
+    return fallback or (None, None, None)
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+class _ProgressWriter:
+    """File wrapper that reports download progress only when the percentage changes."""
+    def __init__(self, f, total_length: int, progress_callback):
+        self.f = f
+        self.total_length = total_length
+        self.progress_callback = progress_callback
+        self.written = 0
+        self.last_pct = -1
+
+    def write(self, data) -> int:
+        n = self.f.write(data)
+        self.written += len(data)
+        pct = min(100, int(self.written * 100 / self.total_length))
+        if pct != self.last_pct:
+            self.last_pct = pct
+            self.progress_callback(pct)
+        return n
+
+class _SharedProgress:
+    """Thread-safe byte counter for ranged downloads; reports only when the percentage changes."""
+    def __init__(self, total_length: int, progress_callback):
+        self.total_length = total_length
+        self.progress_callback = progress_callback
+        self.done = 0
+        self.last_pct = -1
+        self.lock = threading.Lock()
+
+    def add(self, n: int):
+        with self.lock:
+            self.done += n
+            pct = min(100, int(self.done * 100 / self.total_length))
+            if pct != self.last_pct:
+                self.last_pct = pct
+                self.progress_callback(pct)
+
+# Archives up to this size are downloaded into memory and extracted from there
+IN_MEMORY_ARCHIVE_MAX = 64 * 1024 * 1024
+# Larger ones are fetched as this many byte ranges at once when the server allows it,
+# since one TCP connection rarely fills the link on its own
+RANGE_DOWNLOAD_PARTS = 4
+RANGE_DOWNLOAD_MIN = 8 * 1024 * 1024
+
+def _copy_range(src, out, length: int, progress: _SharedProgress | None, stop: threading.Event):
+    while length > 0:
+        if stop.is_set():
+            raise InterruptedError("range download cancelled")
+        chunk = src.read(min(DOWNLOAD_CHUNK_SIZE, length))
+        if not chunk:
+            raise ConnectionError("connection closed before the range was complete")
+        out.write(chunk)
+        length -= len(chunk)
+        if progress:
+            progress.add(len(chunk))
+
+def _download_in_parts(r: requests.Response, total_length: int, dest_path: str, parts: int,
+                       progress_callback=None):
+    """Fills dest_path with parts concurrent Range requests. The first range is read from r,
+    the response already open; the others go to r.url, where any redirect ended up."""
+    url = r.url
+    size = -(-total_length // parts)
+    bounds = [(start, min(start + size, total_length)) for start in range(0, total_length, size)]
+    progress = _SharedProgress(total_length, progress_callback) if progress_callback else None
+    stop = threading.Event()
+    with open(dest_path, 'wb') as f:
+        f.truncate(total_length)
+
+    def fetch(bound, response=None):
+        start, end = bound
+        try:
+            if response is None:
+                response = _SESSION.get(url, stream=True, timeout=30, headers={
+                    "Range": f"bytes={start}-{end - 1}", "Accept-Encoding": "identity"})
+                if response.status_code != 206 or not response.headers.get('Content-Range', '').startswith(f"bytes {start}-"):
+                    response.close()
+                    raise ConnectionError(f"range request answered {response.status_code}")
+            with response, open(dest_path, 'r+b') as out:
+                out.seek(start)
+                _copy_range(response.raw, out, end - start, progress, stop)
+        except BaseException:
+            stop.set()
+            raise
+
+    with ThreadPoolExecutor(max_workers=len(bounds) - 1, thread_name_prefix="flarm-range") as ex:
+        futures = [ex.submit(fetch, bound) for bound in bounds[1:]]
+        try:
+            fetch(bounds[0], r)
+        finally:
+            for fut in futures:
+                fut.result()
+
+def download_file(url: str, dest_path: str, progress_callback=None, in_memory_max: int = 0,
+                  parts: int = RANGE_DOWNLOAD_PARTS) -> str | io.BytesIO:
+    """Downloads url to dest_path and returns the path. A response whose Content-Length is at most
+    in_memory_max is kept in a BytesIO instead (returned rewound), so it is never read back from disk.
+    Large downloads are split into parts byte ranges fetched in parallel; parts=1 never splits."""
+    with _SESSION.get(url, stream=True, timeout=30) as r:
         r.raise_for_status()
         total_length = r.headers.get('content-length')
-        dl = 0
         total_length = int(total_length) if total_length else None
-        
+
+        if (parts > 1 and total_length is not None and total_length > in_memory_max
+                and total_length >= RANGE_DOWNLOAD_MIN
+                and r.headers.get('Accept-Ranges', '').lower() == 'bytes'
+                and not r.headers.get('Content-Encoding')):
+            try:
+                _download_in_parts(r, total_length, dest_path, parts, progress_callback)
+                return dest_path
+            except Exception:
+                pass
+            # Some part failed or the server ignored Range: start over as one plain stream
+            r.close()
+            return download_file(url, dest_path, progress_callback, in_memory_max, parts=1)
+
+        if total_length is not None and total_length <= in_memory_max:
+            buffer = io.BytesIO()
+            r.raw.decode_content = True
+            out = _ProgressWriter(buffer, total_length, progress_callback) if progress_callback and total_length else buffer
+            shutil.copyfileobj(r.raw, out, DOWNLOAD_CHUNK_SIZE)
+            buffer.seek(0)
+            return buffer
+
         with open(dest_path, 'wb') as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    dl += len(chunk)
-                    f.write(chunk)
-                    if progress_callback and total_length:
-                        progress_callback(int(dl * 100 / total_length))
+            r.raw.decode_content = True
+            out = _ProgressWriter(f, total_length, progress_callback) if progress_callback and total_length else f
+            shutil.copyfileobj(r.raw, out, DOWNLOAD_CHUNK_SIZE)
     return dest_path
 
-def extract_archive(file_path: str, extract_to: str) -> bool:
+DETAILS_XML_MAX_BYTES = 1024 * 1024
+DETAILS_XML_CHUNK = 64 * 1024
+
+def download_details_xml(url: str, dest_path: str, etag: str = None) -> bool | None:
+    """Streams a details.xml straight to dest_path, refusing anything over DETAILS_XML_MAX_BYTES.
+    With etag the request is conditional. Returns True when a new copy was written (its ETag goes to
+    dest_path + '.etag'), None when the server answered 304 Not Modified, False when the body is too
+    large or is not XML. HTTP errors are raised."""
+    headers = {"If-None-Match": etag} if etag else None
+    with _SESSION.get(url, stream=True, timeout=(3, 5), headers=headers) as r:
+        if r.status_code == 304:
+            return None
+        r.raise_for_status()
+        if int(r.headers.get('content-length') or 0) > DETAILS_XML_MAX_BYTES:
+            return False
+        # raw.githubusercontent.com serves every file as text/plain, so the Content-Type can only
+        # rule out HTML error pages; the first bytes are checked for markup as well
+        if r.headers.get('content-type', '').split(';')[0].strip().lower() == 'text/html':
+            return False
+        r.raw.decode_content = True
+        first = r.raw.read(DETAILS_XML_CHUNK)
+        head = first.lstrip(b'\xef\xbb\xbf \t\r\n')[:64].lower()
+        if not head.startswith(b'<') or head.startswith((b'<!doctype html', b'<html')):
+            return False
+        written = 0
+        with open(dest_path, 'wb') as f:
+            chunk = first
+            while chunk:
+                written += len(chunk)
+                if written > DETAILS_XML_MAX_BYTES:
+                    break
+                f.write(chunk)
+                chunk = r.raw.read(DETAILS_XML_CHUNK)
+        if written > DETAILS_XML_MAX_BYTES:
+            os.remove(dest_path)
+            return False
+        new_etag = r.headers.get('ETag')
+        if new_etag:
+            with open(dest_path + '.etag', 'w', encoding='utf-8') as f:
+                f.write(new_etag)
+    return True
+
+def read_saved_details_xml(install_dir: str) -> tuple[str, bytes] | None:
+    """(etag, content) of a details.xml previously saved by download_details_xml into install_dir."""
+    details_path = os.path.join(install_dir, "details.xml")
+    try:
+        with open(details_path + '.etag', encoding='utf-8') as f:
+            etag = f.read().strip()
+        with open(details_path, 'rb') as f:
+            content = f.read(DETAILS_XML_MAX_BYTES + 1)
+    except OSError:
+        return None
+    if not etag or len(content) > DETAILS_XML_MAX_BYTES:
+        return None
+    return etag, content
+
+def _zip_member_dest(extract_to: str, filename: str) -> str | None:
+    """Maps a zip member name to a path inside extract_to, dropping unsafe components like ZipFile.extract does."""
+    parts = [p for p in filename.replace('\\', '/').split('/') if p not in ('', '.', '..')]
+    if not parts:
+        return None
+    parts[0] = os.path.splitdrive(parts[0])[1] or parts[0]
+    return os.path.join(extract_to, *parts)
+
+# Archives with at least this many files are inflated on several threads (zlib releases the GIL)
+ZIP_PARALLEL_MIN_FILES = 16
+
+def _write_zip_member(z: zipfile.ZipFile, info: zipfile.ZipInfo, dest: str):
+    if info.file_size == 0:
+        open(dest, 'wb').close()
+    else:
+        with z.open(info) as src, open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst, min(info.file_size, DOWNLOAD_CHUNK_SIZE))
+    # Keep the executable bit for packages built on POSIX systems
+    mode = (info.external_attr >> 16) & 0o777
+    if mode and os.name != 'nt' and info.create_system == 3:
+        os.chmod(dest, mode)
+
+def _extract_zip(z: zipfile.ZipFile, extract_to: str, data: bytes = None):
+    """Extracts all members with one read buffer per file, skipping ZipFile.extractall's per-member overhead.
+    data is the archive itself when z reads from memory; worker threads open their own view of it."""
+    files = []
+    dirs = set()
+    for info in z.infolist():
+        dest = _zip_member_dest(extract_to, info.filename)
+        if dest is None:
+            continue
+        if info.is_dir():
+            dirs.add(dest)
+        else:
+            files.append((info, dest))
+            dirs.add(os.path.dirname(dest))
+
+    # Build the directory skeleton once: deepest paths first, and a path that is
+    # already an ancestor of a created one needs no call of its own
+    created = set()
+    for d in sorted(dirs, key=len, reverse=True):
+        if d in created:
+            continue
+        os.makedirs(d, exist_ok=True)
+        while d not in created and len(d) > len(extract_to):
+            created.add(d)
+            d = os.path.dirname(d)
+
+    workers = min(8, os.cpu_count() or 1)
+    if len(files) < ZIP_PARALLEL_MIN_FILES or workers < 2 or not (z.filename or data is not None):
+        for info, dest in files:
+            _write_zip_member(z, info, dest)
+        return
+
+    # A ZipFile serialises reads on one file handle, so every worker thread opens its own
+    local = threading.local()
+    opened = []
+    def _extract_one(item):
+        zf = getattr(local, 'zf', None)
+        if zf is None:
+            # BytesIO over the same bytes object shares it instead of copying
+            zf = local.zf = zipfile.ZipFile(io.BytesIO(data) if data is not None else z.filename, 'r')
+            opened.append(zf)
+        _write_zip_member(zf, *item)
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flarm-unzip") as ex:
+            list(ex.map(_extract_one, files))
+    finally:
+        for zf in opened:
+            zf.close()
+
+def extract_archive(file_path: str | io.BytesIO, extract_to: str, name: str = None) -> bool:
+    """Extracts a zip or tar archive from a path or an in-memory buffer (see download_file).
+    Anything else is copied into extract_to as is, under name (default: the file's own name)."""
+    if isinstance(file_path, io.BytesIO):
+        data = file_path.getvalue()
+        if zipfile.is_zipfile(file_path):
+            with zipfile.ZipFile(io.BytesIO(data), 'r') as z:
+                _extract_zip(z, str(extract_to), data)
+            return True
+        try:
+            with tarfile.open(fileobj=io.BytesIO(data), mode='r:*') as t:
+                t.extractall(extract_to)
+            return True
+        except Exception:
+            pass
+        (Path(extract_to) / (name or 'package')).write_bytes(data)
+        return False
+
     file_path = str(file_path)
     if zipfile.is_zipfile(file_path):
         with zipfile.ZipFile(file_path, 'r') as z:
-            z.extractall(extract_to)
+            _extract_zip(z, str(extract_to))
         return True
     try:
         if tarfile.is_tarfile(file_path):
@@ -359,63 +721,257 @@ def extract_archive(file_path: str, extract_to: str) -> bool:
             return True
     except Exception:
         pass
-    dest = Path(extract_to) / Path(file_path).name
+    dest = Path(extract_to) / (name or Path(file_path).name)
     shutil.copy(file_path, str(dest))
     return False
 
+# Folders packages usually keep their entry point in, probed before walking the tree
+_EXECUTABLE_PROBE_DIRS = ('', 'bin', 'app')
+
+def _is_launchable(st: os.stat_result) -> bool:
+    return os.name == 'nt' or bool(st.st_mode & 0o111)
+
 def find_executable(root_dir: Path, shortname: str) -> Path | None:
-    root = Path(root_dir)
-    for p in root.rglob('*'):
-        if p.is_file():
-            name = p.name.lower()
-            if name == f"{shortname.lower()}.exe":
-                return p
-            if name == shortname.lower():
+    bare = shortname.lower()
+    exe_name = f"{bare}.exe"
+    elf_name = f"{bare}.elf"
+    root = str(root_dir)
+    for sub in _EXECUTABLE_PROBE_DIRS:
+        for name in (exe_name, elf_name, shortname, bare):
+            path = os.path.join(root, sub, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode) and (name in (exe_name, elf_name) or _is_launchable(st)):
+                return Path(path)
+
+    stack = deque([root])
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SCAN_SKIP_DIRS:
+                        stack.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            name = entry.name.lower()
+            if name == exe_name or name == elf_name:
+                return Path(entry.path)
+            if name == bare:
                 try:
-                    if os.name != 'nt':
-                        if os.access(p, os.X_OK):
-                            return p
-                    else:
-                        return p
-                except Exception:
-                    return p
-            if name == f"{shortname.lower()}.elf":
-                return p
+                    if _is_launchable(entry.stat(follow_symlinks=False)):
+                        return Path(entry.path)
+                except OSError:
+                    return Path(entry.path)
     return None
 
-def create_documents_app_folder(publisher: str, app: str, version: str, platformstr: str) -> Path:
-    home = Path.home()
+# Sidecar in the install folder naming the executable found at install time (relative path)
+INSTALLED_EXE_FILE = ".flarm-exe"
+
+def remembered_executable(install_dir: Path) -> Path | None:
+    """The executable recorded by find_installed_executable, if it is still there."""
+    try:
+        rel = (Path(install_dir) / INSTALLED_EXE_FILE).read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    exe_path = Path(install_dir) / rel
+    return exe_path if rel and exe_path.is_file() else None
+
+def find_installed_executable(archive_path: str | io.BytesIO, dest_base: Path, shortname: str) -> Path | None:
+    """Locates the app executable after installing archive_path into dest_base and records it
+    in INSTALLED_EXE_FILE, so launching it later needs no search.
+    For zip packages the member list already says where it is, so the tree is only walked as a fallback."""
+    exe_path = _locate_installed_executable(archive_path, dest_base, shortname)
+    if exe_path:
+        try:
+            (Path(dest_base) / INSTALLED_EXE_FILE).write_text(
+                os.path.relpath(exe_path, dest_base), encoding='utf-8')
+        except (OSError, ValueError):
+            pass
+    return exe_path
+
+def _locate_installed_executable(archive_path: str | io.BytesIO, dest_base: Path, shortname: str) -> Path | None:
+    bare = shortname.lower()
+    wanted = (f"{bare}.exe", f"{bare}.elf")
+    try:
+        with zipfile.ZipFile(archive_path, 'r') as z:
+            infos = z.infolist()
+    except (zipfile.BadZipFile, OSError):
+        infos = []
+    for info in infos:
+        if info.is_dir():
+            continue
+        name = info.filename.replace('\\', '/').rsplit('/', 1)[-1].lower()
+        # Bare names only count with an executable bit, mirroring find_executable's X_OK check
+        if name in wanted or (name == bare and (os.name == 'nt' or (info.external_attr >> 16) & 0o111)):
+            dest = _zip_member_dest(os.fspath(dest_base), info.filename)
+            if dest and os.path.isfile(dest):
+                return Path(dest)
+    return find_executable(dest_base, shortname)
+
+# Entry points sit near the top of a package; deeper levels are bundled libraries and data
+FIRST_EXE_MAX_DEPTH = 3
+
+def find_first_exe(root_dir: Path) -> Path | None:
+    """Breadth-first search for any .exe up to FIRST_EXE_MAX_DEPTH levels under root_dir, stopping at the first hit."""
+    queue = deque([(str(root_dir), 0)])
+    while queue:
+        current, depth = queue.popleft()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if depth < FIRST_EXE_MAX_DEPTH and entry.name not in _SCAN_SKIP_DIRS:
+                        queue.append((entry.path, depth + 1))
+                elif entry.name.lower().endswith('.exe') and entry.is_file(follow_symlinks=False):
+                    return Path(entry.path)
+            except OSError:
+                continue
+    return None
+
+@functools.lru_cache(maxsize=1)
+def _documents_dir() -> Path:
     if os.name == 'nt':
-        documents = Path(os.path.join(os.environ.get('USERPROFILE',''), 'Documents'))
-    else:
-        documents = home / 'Documents'
+        return Path(os.environ.get('USERPROFILE','')) / 'Documents'
+    return Path.home() / 'Documents'
+
+# {B4BFCC3A-DB2C-424C-B029-7FE99A87C641}, in the little-endian layout of a Windows GUID
+_FOLDERID_DESKTOP = bytes.fromhex('3accbfb42cdb4c42b0297fe99a87c641')
+
+def _known_folder(folder_id: bytes) -> Path | None:
+    """Resolves a Windows known folder with SHGetKnownFolderPath; None if unavailable."""
+    try:
+        guid = (ctypes.c_ubyte * 16).from_buffer_copy(folder_id)
+        pwsz = ctypes.c_wchar_p()
+        if ctypes.windll.shell32.SHGetKnownFolderPath(ctypes.byref(guid), 0, None, ctypes.byref(pwsz)) != 0:
+            return None
+        try:
+            return Path(pwsz.value)
+        finally:
+            ctypes.windll.ole32.CoTaskMemFree(pwsz)
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _desktop_dir() -> Path:
+    # The Desktop folder may be localized ("Escritorio") or redirected, so ask the shell for it
+    if _IS_WINDOWS:
+        desktop = _known_folder(_FOLDERID_DESKTOP)
+        if desktop:
+            return desktop
+    return Path.home() / 'Desktop'
+
+@functools.lru_cache(maxsize=1)
+def _fluthin_apps_dir() -> Path:
+    """Documents/Fluthin Apps, where every package is installed."""
+    return _documents_dir() / 'Fluthin Apps'
+
+def documents_app_folder_path(publisher: str, app: str, version: str, platformstr: str) -> str:
     # New format: {publisher}-{app}-{version}-{platform}
-    base = documents / 'Fluthin Apps' / f"{publisher}-{app}-{version}-{platformstr}"
-    base.mkdir(parents=True, exist_ok=True)
-    return base
+    return os.path.join(_fluthin_apps_dir(), f"{publisher}-{app}-{version}-{platformstr}")
+
+def create_documents_app_folder(publisher: str, app: str, version: str, platformstr: str) -> Path:
+    base = documents_app_folder_path(publisher, app, version, platformstr)
+    os.makedirs(base, exist_ok=True)
+    return Path(base)
+
+@functools.lru_cache(maxsize=1)
+def _temp_root() -> Path:
+    """Per-process temp root for metadata and download dirs, removed once at interpreter exit."""
+    root = Path(tempfile.mkdtemp(prefix="Fluthin_"))
+    atexit.register(shutil.rmtree, root, ignore_errors=True)
+    return root
+
+def make_temp_dir(prefix: str) -> Path:
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=_temp_root()))
+
+def make_staging_dir() -> Path:
+    """Temp dir inside Fluthin Apps: same filesystem as every install target, so move_install_tree only renames."""
+    apps_dir = _fluthin_apps_dir()
+    apps_dir.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=".Fluthin_stage_", dir=apps_dir))
+
+def discard_tree(path: Path):
+    """Deletes a directory tree on a background thread. The thread is not a daemon, so the
+    deletion still completes if the app is closed meanwhile."""
+    threading.Thread(target=shutil.rmtree, args=(os.fspath(path),), kwargs={'ignore_errors': True},
+                     name="flarm-cleanup").start()
 
 def move_install_tree(temp_extract_dir: Path, target_dir: Path) -> Path:
-    targ = Path(target_dir)
-    for item in Path(temp_extract_dir).iterdir():
-        dest = targ / item.name
-        if item.is_dir():
-            if dest.exists():
+    """Moves the extracted tree into target_dir. On the same filesystem, directories it replaces
+    are parked inside temp_extract_dir instead of deleted, so they go away with it."""
+    targ = os.fspath(target_dir)
+    targ_st = os.stat(targ)
+    same_fs = os.stat(temp_extract_dir).st_dev == targ_st.st_dev
+    with os.scandir(targ) as it:
+        targ_empty = next(it, None) is None
+    if same_fs and targ_empty:
+        # Fresh install: swap the whole extracted tree in with one rename
+        os.rmdir(targ)
+        try:
+            os.rename(temp_extract_dir, targ)
+        except OSError as e:
+            os.mkdir(targ)
+            if e.errno != errno.EXDEV:
+                raise
+        else:
+            # mkdtemp dirs are owner-only; keep the permissions the install folder was created with
+            os.chmod(targ, targ_st.st_mode & 0o7777)
+            return Path(targ)
+    with os.scandir(temp_extract_dir) as it:
+        entries = list(it)
+    parked = None
+    for entry in entries:
+        src = entry.path
+        dest = os.path.join(targ, entry.name)
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if same_fs:
+            # Same filesystem: a rename is a single metadata operation
+            if is_dir:
+                if os.path.exists(dest):
+                    # Renaming the old copy aside is instant; deleting it is left to the caller's cleanup
+                    if parked is None:
+                        parked = tempfile.mkdtemp(prefix=".Fluthin_old_", dir=temp_extract_dir)
+                    os.rename(dest, os.path.join(parked, entry.name))
+                os.rename(src, dest)
+            else:
+                os.replace(src, dest)
+        elif is_dir:
+            if os.path.exists(dest):
                 shutil.rmtree(dest)
-            shutil.move(str(item), str(dest))
+            shutil.move(src, dest)
         else:
-            if dest.exists():
-                dest.unlink()
-            shutil.move(str(item), str(dest))
-    return targ
+            if os.path.exists(dest):
+                os.unlink(dest)
+            shutil.move(src, dest)
+    return Path(targ)
 
 def create_shortcut(desktop_path: Path, target: Path, name: str, args: str = "") -> str:
     desktop_path.mkdir(parents=True, exist_ok=True)
-    system = platform.system().lower()
+    system = _SYSPLAT
     if 'windows' in system:
-        if HAS_PYWIN32:
+        pywin32 = _pywin32()
+        if pywin32:
+            pythoncom, client = pywin32
             shortcut_path = str(desktop_path / (name + '.lnk'))
             try:
-                shell = win32com.client.Dispatch("WScript.Shell")
+                # Installs run on pool threads, where COM is not initialized yet
+                pythoncom.CoInitialize()
+                shell = client.Dispatch("WScript.Shell")
                 lnk = shell.CreateShortCut(shortcut_path)
                 lnk.Targetpath = str(target)
                 lnk.Arguments = args
@@ -451,6 +1007,33 @@ def create_shortcut(desktop_path: Path, target: Path, name: str, args: str = "")
         return str(file_path)
 
 # --- Registry & Protocol Registration ---
+_RRF_RT_REG_SZ, _RRF_RT_REG_EXPAND_SZ, _RRF_NOEXPAND = 0x02, 0x04, 0x10000000
+_ERROR_FILE_NOT_FOUND, _ERROR_MORE_DATA = 2, 234
+
+def read_default_value(parent, subkey: str) -> str:
+    """Reads the default string value of parent\\subkey.
+    Uses a single RegGetValueW call (open + query + close) when available, winreg otherwise."""
+    try:
+        from ctypes import wintypes
+        reg_get_value = ctypes.WinDLL("advapi32").RegGetValueW
+    except (AttributeError, OSError, ValueError):
+        with winreg.OpenKeyEx(parent, subkey, 0, winreg.KEY_READ) as key:
+            return winreg.QueryValueEx(key, "")[0]
+    reg_get_value.argtypes = [wintypes.HKEY, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                              ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p, ctypes.POINTER(wintypes.DWORD)]
+    size = wintypes.DWORD(512)
+    while True:
+        buf = ctypes.create_unicode_buffer(size.value // ctypes.sizeof(ctypes.c_wchar) + 1)
+        size = wintypes.DWORD(ctypes.sizeof(buf))
+        rc = reg_get_value(int(parent), subkey, None, _RRF_RT_REG_SZ | _RRF_RT_REG_EXPAND_SZ | _RRF_NOEXPAND,
+                           None, buf, ctypes.byref(size))
+        if rc == 0:
+            return buf.value
+        if rc == _ERROR_FILE_NOT_FOUND:
+            raise FileNotFoundError(rc, "Registry key or value not found", subkey)
+        if rc != _ERROR_MORE_DATA:
+            raise ctypes.WinError(rc)
+
 def check_registry_keys(python_path: str, script_path: str) -> tuple[bool, list[str]]:
     """Check registry keys and return (is_valid, list_of_issues)."""
     if winreg is None: 
@@ -494,17 +1077,14 @@ def check_registry_keys(python_path: str, script_path: str) -> tuple[bool, list[
         if not cmd:
             return None, None
         
-        import re
         # Pattern 1: "python" "script" -flag ...
-        pattern_script = r'"([^"]+)"\s+"([^"]+)"'
-        match_script = re.search(pattern_script, cmd)
+        match_script = _CMD_SCRIPT_RE.search(cmd)
         
         if match_script:
             return normalize_path(match_script.group(1)), normalize_path(match_script.group(2))
             
         # Pattern 2: "exe" -flag ...
-        pattern_exe = r'"([^"]+)"'
-        match_exe = re.search(pattern_exe, cmd)
+        match_exe = _CMD_EXE_RE.search(cmd)
         
         if match_exe:
             # Return exe path as first arg, None as second
@@ -512,12 +1092,10 @@ def check_registry_keys(python_path: str, script_path: str) -> tuple[bool, list[
             
         return None, None
 
-    # Helper to check a key with better error reporting
-    def check_key(root, key_path, expected_val=None, key_name=""):
+    # Helper to check a key (relative to an already-open parent) with better error reporting
+    def check_key(parent, key_path, expected_val=None, key_name=""):
         try:
-            key = winreg.OpenKey(root, key_path)
-            val, _ = winreg.QueryValueEx(key, "")
-            winreg.CloseKey(key)
+            val = read_default_value(parent, key_path)
             
             if expected_val:
                 # For commands, normalize and compare
@@ -560,43 +1138,41 @@ def check_registry_keys(python_path: str, script_path: str) -> tuple[bool, list[
             issues.append(f"{key_name}: error al leer ({str(e)})")
             return False
 
-    # 1. Check Protocol in HKCU or HKCR
-    protocol_ok = check_key(winreg.HKEY_CURRENT_USER, rf"Software\Classes\{SCHEME}\shell\open\command", 
-                           expected_cmd_protocol, "Protocolo Fluthinstore (HKCU)")
-    if not protocol_ok:
-        # Try HKCR as fallback
-        protocol_ok = check_key(winreg.HKEY_CLASSES_ROOT, rf"{SCHEME}\shell\open\command", 
-                               expected_cmd_protocol, "Protocolo Fluthinstore (HKCR)")
-            
-    # 2. Check .iflapp extension in HKCU or HKCR
-    ext_ok = check_key(winreg.HKEY_CURRENT_USER, rf"Software\Classes\.iflapp", 
-                      "Fluthin.Package", "Extensión .iflapp (HKCU)")
-    if not ext_ok:
-        # Try HKCR as fallback
-        ext_ok = check_key(winreg.HKEY_CLASSES_ROOT, rf".iflapp", 
-                          "Fluthin.Package", "Extensión .iflapp (HKCR)")
-            
-    # 3. Check Icon for Fluthin.Package (optional, don't fail if missing)
+    # register_scheme_windows only writes under HKCU\Software\Classes, so open it
+    # once and check every key relative to it (no HKCR round-trips).
     try:
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Classes\Fluthin.Package\DefaultIcon")
-        val, _ = winreg.QueryValueEx(key, "")
-        winreg.CloseKey(key)
-        
-        # Normalize paths for comparison
-        current_icon = normalize_path(val.replace(",0", ""))
-        target_icon = normalize_path(expected_icon)
-        
-        if current_icon != target_icon:
-            issues.append("Icono: ruta no coincide (se actualizará)")
-    except FileNotFoundError:
-        issues.append("Icono: no configurado (se agregará)")
-    except Exception:
-        # Icon is optional, don't fail
-        pass
-    
-    # 4. Check Fluthin.Package command (with -l flag)
-    pkg_cmd_ok = check_key(winreg.HKEY_CURRENT_USER, r"Software\Classes\Fluthin.Package\shell\open\command",
-                          expected_cmd_file, "Comando Fluthin.Package")
+        classes = winreg.OpenKeyEx(winreg.HKEY_CURRENT_USER, r"Software\Classes", 0, winreg.KEY_READ)
+    except OSError as e:
+        return False, [f"HKCU\\Software\\Classes: error al leer ({str(e)})"]
+
+    with classes:
+        # 1. Check Protocol
+        protocol_ok = check_key(classes, rf"{SCHEME}\shell\open\command",
+                               expected_cmd_protocol, "Protocolo Fluthinstore (HKCU)")
+
+        # 2. Check .iflapp extension
+        ext_ok = check_key(classes, ".iflapp",
+                          "Fluthin.Package", "Extensión .iflapp (HKCU)")
+
+        # 3. Check Icon for Fluthin.Package (optional, don't fail if missing)
+        try:
+            val = read_default_value(classes, r"Fluthin.Package\DefaultIcon")
+
+            # Normalize paths for comparison
+            current_icon = normalize_path(val.replace(",0", ""))
+            target_icon = normalize_path(expected_icon)
+
+            if current_icon != target_icon:
+                issues.append("Icono: ruta no coincide (se actualizará)")
+        except FileNotFoundError:
+            issues.append("Icono: no configurado (se agregará)")
+        except Exception:
+            # Icon is optional, don't fail
+            pass
+
+        # 4. Check Fluthin.Package command (with -l flag)
+        pkg_cmd_ok = check_key(classes, r"Fluthin.Package\shell\open\command",
+                              expected_cmd_file, "Comando Fluthin.Package")
             
     # Registry is valid if protocol and extension are OK
     # Icon and package command issues are warnings but not critical
@@ -604,6 +1180,7 @@ def check_registry_keys(python_path: str, script_path: str) -> tuple[bool, list[
     
     return is_valid, issues
 
+@functools.lru_cache(maxsize=1)
 def get_icon_path() -> str:
     """Get the correct path to Fluthinpack.ico whether running as script or compiled."""
     if hasattr(sys, '_MEIPASS'):
@@ -621,6 +1198,12 @@ def get_icon_path() -> str:
     
     return str(icon_path)
 
+@functools.lru_cache(maxsize=1)
+def get_icon_path_cached() -> tuple[str, bool]:
+    """(icon_path, exists) resolved once, so the register_scheme_* helpers don't re-stat it."""
+    icon_path = get_icon_path()
+    return icon_path, os.path.exists(icon_path)
+
 def register_scheme_windows(python_path: str, script_path: str) -> tuple[bool, str]:
     if winreg is None:
         return False, "winreg module not available"
@@ -638,66 +1221,66 @@ def register_scheme_windows(python_path: str, script_path: str) -> tuple[bool, s
         cmd_protocol = f'"{python_path}" "{script_path}" -u "%1"'
         cmd_file = f'"{python_path}" "{script_path}" -l "%1"'
         
-    icon_path = get_icon_path()
+    icon_path, has_icon = get_icon_path_cached()
     
     try:
         # --- CLEANUP: Remove old keys to prevent conflicts ---
-        def delete_key_recursive(root, key_path):
+        def delete_key_recursive(parent, key_path):
             try:
-                open_key = winreg.OpenKey(root, key_path, 0, winreg.KEY_ALL_ACCESS)
-                info = winreg.QueryInfoKey(open_key)
-                for i in range(0, info[0]):
-                    # Delete subkeys first
-                    subkey = winreg.EnumKey(open_key, 0)
-                    delete_key_recursive(root, key_path + "\\" + subkey)
-                winreg.DeleteKey(root, key_path)
-                winreg.CloseKey(open_key)
-            except Exception:
-                pass
+                with winreg.OpenKey(parent, key_path, 0, winreg.KEY_ALL_ACCESS) as open_key:
+                    # Delete subkeys first, relative to the handle already open;
+                    # each deletion moves the next subkey to index 0
+                    while True:
+                        try:
+                            subkey = winreg.EnumKey(open_key, 0)
+                        except OSError:
+                            break
+                        if not delete_key_recursive(open_key, subkey):
+                            break
+                winreg.DeleteKey(parent, key_path)
+                return True
+            except OSError:
+                return False
 
-        # Delete existing keys in HKCU
-        delete_key_recursive(winreg.HKEY_CURRENT_USER, rf"Software\Classes\{SCHEME}")
-        delete_key_recursive(winreg.HKEY_CURRENT_USER, r"Software\Classes\.iflapp")
-        delete_key_recursive(winreg.HKEY_CURRENT_USER, r"Software\Classes\Fluthin.Package")
-        
-        # --- REGISTRATION: Create new keys ---
-        
-        # 1. Register Protocol Fluthinstore://
-        key_path = rf"Software\Classes\{SCHEME}"
-        key = winreg.CreateKey(winreg.HKEY_CURRENT_USER, key_path)
-        winreg.SetValueEx(key, None, 0, winreg.REG_SZ, "URL:Fluthin Store Protocol")
-        winreg.SetValueEx(key, "URL Protocol", 0, winreg.REG_SZ, "")
-        
-        # Icon for protocol
-        if os.path.exists(icon_path):
-            icon_key = winreg.CreateKey(key, "DefaultIcon")
-            winreg.SetValueEx(icon_key, None, 0, winreg.REG_SZ, f"{icon_path},0")
-            winreg.CloseKey(icon_key)
-            
-        shell = winreg.CreateKey(key, r"shell\open\command")
-        winreg.SetValueEx(shell, None, 0, winreg.REG_SZ, cmd_protocol)
-        winreg.CloseKey(shell)
-        winreg.CloseKey(key)
-        
-        # 2. Register .iflapp extension
-        # .iflapp -> Fluthin.Package
-        key_ext = winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\Classes\.iflapp")
-        winreg.SetValueEx(key_ext, None, 0, winreg.REG_SZ, "Fluthin.Package")
-        winreg.CloseKey(key_ext)
-        
-        # Fluthin.Package -> Command with -l flag
-        key_progid = winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\Classes\Fluthin.Package")
-        winreg.SetValueEx(key_progid, None, 0, winreg.REG_SZ, "Fluthin Package")
-        
-        if os.path.exists(icon_path):
-            icon_key = winreg.CreateKey(key_progid, "DefaultIcon")
-            winreg.SetValueEx(icon_key, None, 0, winreg.REG_SZ, f"{icon_path},0")
-            winreg.CloseKey(icon_key)
-            
-        shell_progid = winreg.CreateKey(key_progid, r"shell\open\command")
-        winreg.SetValueEx(shell_progid, None, 0, winreg.REG_SZ, cmd_file)
-        winreg.CloseKey(shell_progid)
-        winreg.CloseKey(key_progid)
+        # All keys live under HKCU\Software\Classes: open it once for the cleanup and
+        # the writes, write every sibling value before descending, and flush the hive a single time.
+        icon_value = f"{icon_path},0"
+
+        with winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\Classes") as classes:
+            # Delete existing keys in HKCU
+            delete_key_recursive(classes, SCHEME)
+            delete_key_recursive(classes, ".iflapp")
+            delete_key_recursive(classes, "Fluthin.Package")
+
+            # --- REGISTRATION: Create new keys ---
+            # 1. Register Protocol Fluthinstore://
+            with winreg.CreateKey(classes, SCHEME) as key:
+                winreg.SetValueEx(key, None, 0, winreg.REG_SZ, "URL:Fluthin Store Protocol")
+                winreg.SetValueEx(key, "URL Protocol", 0, winreg.REG_SZ, "")
+
+                # Icon for protocol
+                if has_icon:
+                    with winreg.CreateKey(key, "DefaultIcon") as icon_key:
+                        winreg.SetValueEx(icon_key, None, 0, winreg.REG_SZ, icon_value)
+
+                with winreg.CreateKey(key, r"shell\open\command") as shell:
+                    winreg.SetValueEx(shell, None, 0, winreg.REG_SZ, cmd_protocol)
+
+            # 2. Register .iflapp extension
+            # .iflapp -> Fluthin.Package
+            with winreg.CreateKey(classes, ".iflapp") as key_ext:
+                winreg.SetValueEx(key_ext, None, 0, winreg.REG_SZ, "Fluthin.Package")
+
+            # Fluthin.Package -> Command with -l flag
+            with winreg.CreateKey(classes, "Fluthin.Package") as key_progid:
+                winreg.SetValueEx(key_progid, None, 0, winreg.REG_SZ, "Fluthin Package")
+
+                if has_icon:
+                    with winreg.CreateKey(key_progid, "DefaultIcon") as icon_key:
+                        winreg.SetValueEx(icon_key, None, 0, winreg.REG_SZ, icon_value)
+
+                with winreg.CreateKey(key_progid, r"shell\open\command") as shell_progid:
+                    winreg.SetValueEx(shell_progid, None, 0, winreg.REG_SZ, cmd_file)
 
         # Notify Shell of changes
         try:
@@ -719,10 +1302,10 @@ def register_scheme_linux(python_path: str, script_path: str) -> tuple[bool, str
         desktop_file = user_apps / f"Fluthinstore-handler.desktop"
         exec_cmd = f"{python_path} {script_path} %u"
         
-        icon_path = get_icon_path()
+        icon_path, has_icon = get_icon_path_cached()
         
         content = "[Desktop Entry]\nName=Fluthinstore Handler\nExec=" + exec_cmd + "\nType=Application\nTerminal=false\nMimeType=x-scheme-handler/" + SCHEME + ";\n"
-        if os.path.exists(icon_path):
+        if has_icon:
             content += f"Icon={icon_path}\n"
             
         desktop_file.write_text(content, encoding='utf-8')
@@ -732,6 +1315,8 @@ def register_scheme_linux(python_path: str, script_path: str) -> tuple[bool, str
     except Exception as e:
         return False, str(e)
 
+LSREGISTER = "/System/Library/Frameworks/CoreServices.framework/Frameworks/LaunchServices.framework/Support/lsregister"
+
 def register_scheme_macos(python_path: str, script_path: str) -> tuple[bool, str]:
     try:
         apps_dir = Path.home() / "Applications"
@@ -745,8 +1330,8 @@ def register_scheme_macos(python_path: str, script_path: str) -> tuple[bool, str
         resources.mkdir(parents=True, exist_ok=True)
         
         # Copy icon
-        icon_src = get_icon_path()
-        if os.path.exists(icon_src):
+        icon_src, has_icon = get_icon_path_cached()
+        if has_icon:
             shutil.copy(icon_src, resources / "Fluthinpack.ico")
         
         wrapper = macos_dir / "Fluthinhandler"
@@ -754,33 +1339,25 @@ def register_scheme_macos(python_path: str, script_path: str) -> tuple[bool, str
         wrapper.write_text(wrapper_text, encoding='utf-8')
         wrapper.chmod(0o755)
         info_plist = contents / "Info.plist"
-        plist_lines = []
-        plist_lines.append('<?xml version="1.0" encoding="UTF-8"?>')
-        plist_lines.append('<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">')
-        plist_lines.append('<plist version="1.0">')
-        plist_lines.append('<dict>')
-        plist_lines.append('    <key>CFBundleName</key><string>FluthinHandler</string>')
-        plist_lines.append('    <key>CFBundleIdentifier</key><string>com.Fluthin.handler</string>')
-        plist_lines.append('    <key>CFBundleExecutable</key><string>Fluthinhandler</string>')
-        plist_lines.append('    <key>CFBundlePackageType</key><string>APPL</string>')
-        plist_lines.append('    <key>CFBundleShortVersionString</key><string>1.0</string>')
-        if os.path.exists(icon_src):
-             plist_lines.append('    <key>CFBundleIconFile</key><string>app-icon.ico</string>')
-        plist_lines.append('    <key>CFBundleURLTypes</key>')
-        plist_lines.append('    <array>')
-        plist_lines.append('        <dict>')
-        plist_lines.append('            <key>CFBundleURLName</key><string>Fluthin Store</string>')
-        plist_lines.append('            <key>CFBundleURLSchemes</key>')
-        plist_lines.append('            <array>')
-        plist_lines.append('                <string>' + SCHEME + '</string>')
-        plist_lines.append('            </array>')
-        plist_lines.append('        </dict>')
-        plist_lines.append('    </array>')
-        plist_lines.append('</dict>')
-        plist_lines.append('</plist>')
-        info_plist.write_text("\n".join(plist_lines), encoding='utf-8')
-        subprocess.run(["open", str(app_dir)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        time.sleep(1.2)
+        plist = {
+            'CFBundleName': 'FluthinHandler',
+            'CFBundleIdentifier': 'com.Fluthin.handler',
+            'CFBundleExecutable': 'Fluthinhandler',
+            'CFBundlePackageType': 'APPL',
+            'CFBundleShortVersionString': '1.0',
+        }
+        if has_icon:
+            plist['CFBundleIconFile'] = 'Fluthinpack.ico'
+        plist['CFBundleURLTypes'] = [{'CFBundleURLName': 'Fluthin Store', 'CFBundleURLSchemes': [SCHEME]}]
+        import plistlib
+        info_plist.write_bytes(plistlib.dumps(plist))
+        # Register the bundle with LaunchServices directly: lsregister returns once it is done,
+        # so there is no need to open the app and wait for Finder to notice it
+        if os.path.exists(LSREGISTER):
+            subprocess.run([LSREGISTER, "-f", str(app_dir)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            subprocess.run(["open", str(app_dir)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            time.sleep(1.2)
         return True, str(app_dir)
     except Exception as e:
         return False, str(e)
@@ -788,9 +1365,11 @@ def register_scheme_macos(python_path: str, script_path: str) -> tuple[bool, str
 
 def ensure_registered(python_path: str, script_path: str) -> tuple[bool, str, bool]:
     """Returns (success, message, was_modified)"""
-    system = platform.system().lower()
+    system = _SYSPLAT
     if 'windows' in system:
-        if check_registry_keys(python_path, script_path):
+        # Any reported issue triggers the rewrite, including the icon check that is_valid leaves out
+        is_valid, issues = check_registry_keys(python_path, script_path)
+        if is_valid and not issues:
             return True, "Already registered correctly", False
         
         # Try to register in HKCU (no admin needed usually)
@@ -814,6 +1393,58 @@ def ensure_registered(python_path: str, script_path: str) -> tuple[bool, str, bo
 
 # --- UI Components ---
 
+# (name, device pixel ratio) -> icon rendered from WIN11_ICONS
+_TITLE_ICON_CACHE: dict[tuple[str, float], QtGui.QIcon] = {}
+# Glyph stroke per button: (color, width in viewBox units)
+_TITLE_ICON_STROKES = {"close": ("#e81123", 1.5)}
+_TITLE_ICON_DEFAULT_STROKE = ("#202124", 1.2)
+
+def _build_title_icon(name: str) -> QtGui.QIcon:
+    """Renders a title bar glyph from its WIN11_ICONS path once per process and pixel ratio,
+    and returns the shared QIcon. The 32x32 glyph is centered in the 46x32 button."""
+    app = QtWidgets.QApplication.instance()
+    ratio = app.devicePixelRatio() if app is not None else 1.0
+    key = (name, ratio)
+    icon = _TITLE_ICON_CACHE.get(key)
+    if icon is not None:
+        return icon
+
+    color, width = _TITLE_ICON_STROKES.get(name, _TITLE_ICON_DEFAULT_STROKE)
+    svg = (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32">'
+           f'<path d="{WIN11_ICONS[name]}" fill="none" stroke="{color}" stroke-width="{width}"/></svg>')
+    renderer = QtSvg.QSvgRenderer(QtCore.QByteArray(svg.encode('ascii')))
+
+    pixmap = QtGui.QPixmap(round(46 * ratio), round(32 * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(pixmap)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    renderer.render(painter, QtCore.QRectF(7, 0, 32, 32))
+    painter.end()
+
+    icon = QtGui.QIcon(pixmap)
+    _TITLE_ICON_CACHE[key] = icon
+    return icon
+
+_PIXMAP_CACHE: dict[str, QtGui.QPixmap | None] = {}
+
+def _cached_pixmap(path: str) -> QtGui.QPixmap | None:
+    """Decodes a bundled image once per process; None when the file is missing or unreadable."""
+    if path not in _PIXMAP_CACHE:
+        pix = QtGui.QPixmap(path) if os.path.exists(path) else None
+        _PIXMAP_CACHE[path] = pix if pix is not None and not pix.isNull() else None
+    return _PIXMAP_CACHE[path]
+
+def _scaled_pixmap(pixmap: QtGui.QPixmap, w: int, h: int,
+                   mode=QtCore.Qt.KeepAspectRatio) -> QtGui.QPixmap:
+    """Smoothly scaled copy of pixmap, kept in QPixmapCache so a size seen before is not filtered again."""
+    key = f"{pixmap.cacheKey()}|{w}x{h}|{int(mode)}"
+    scaled = QtGui.QPixmapCache.find(key)
+    if scaled is None:
+        scaled = pixmap.scaled(w, h, mode, QtCore.Qt.SmoothTransformation)
+        QtGui.QPixmapCache.insert(key, scaled)
+    return scaled
+
 class CustomTitleBar(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -833,6 +1464,8 @@ class CustomTitleBar(QtWidgets.QWidget):
         self.btn_min = self.create_btn("minimize")
         self.btn_max = self.create_btn("maximize")
         self.btn_close = self.create_btn("close")
+        self._icon_max = _build_title_icon("maximize")
+        self._icon_restore = _build_title_icon("restore")
         
         layout.addWidget(self.btn_min)
         layout.addWidget(self.btn_max)
@@ -853,61 +1486,17 @@ class CustomTitleBar(QtWidgets.QWidget):
             btn.setObjectName("TitleBtn")
             btn.setProperty("id", "close")
         
-        # Create icon
-        pixmap = QtGui.QPixmap(46, 32)
-        pixmap.fill(QtCore.Qt.transparent)
-        painter = QtGui.QPainter(pixmap)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        
-        pen = QtGui.QPen(QtGui.QColor("#202124"))
-        pen.setWidthF(1.2)
-        
-        if name == "close":
-            pen.setColor(QtGui.QColor("#e81123")) # Red X
-            pen.setWidthF(1.5)
-            painter.setPen(pen)
-            # Draw X
-            # Center x=23, y=16. Size ~10px
-            painter.drawLine(18, 11, 28, 21)
-            painter.drawLine(28, 11, 18, 21)
-            
-        elif name == "minimize":
-            painter.setPen(pen)
-            # Draw Line
-            painter.drawLine(18, 16, 28, 16)
-            
-        elif name == "maximize":
-            painter.setPen(pen)
-            # Draw Rounded Rect
-            painter.drawRoundedRect(18, 11, 10, 10, 2, 2)
-            
-        elif name == "restore":
-            painter.setPen(pen)
-            # Draw Overlapping Rects
-            # Back rect
-            path = QtGui.QPainterPath()
-            path.addRoundedRect(20, 9, 10, 10, 2, 2)
-            # Front rect (filled to hide back lines?) No, just outline
-            # Actually restore is complex with rounded rects.
-            # Simplified:
-            painter.drawRoundedRect(20, 9, 9, 9, 1, 1) # Back
-            # Fill front to cover lines
-            painter.setBrush(QtGui.QColor("#ffffff"))
-            painter.drawRoundedRect(17, 12, 9, 9, 1, 1) # Front
-            
-        painter.end()
-        
-        btn.setIcon(QtGui.QIcon(pixmap))
+        btn.setIcon(_build_title_icon(name))
         btn.setIconSize(QtCore.QSize(46, 32))
         return btn
 
     def toggle_max(self):
         if self.window().isMaximized():
             self.window().showNormal()
-            self.btn_max.setIcon(self.create_btn("maximize").icon())
+            self.btn_max.setIcon(self._icon_max)
         else:
             self.window().showMaximized()
-            self.btn_max.setIcon(self.create_btn("restore").icon())
+            self.btn_max.setIcon(self._icon_restore)
 
     def mousePressEvent(self, event):
         self.start = self.mapToGlobal(event.pos())
@@ -935,13 +1524,21 @@ class BlurredBanner(QtWidgets.QWidget):
         
         self.fg_label = QtWidgets.QLabel(self)
         self.fg_label.setAlignment(QtCore.Qt.AlignCenter)
+
+        # Coalesce bursts of resize events (window drags) into one rescale per frame
+        self._last_wh = None
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self.update_images)
         
     def setPixmap(self, pixmap):
         self._original_pixmap = pixmap
+        self._last_wh = None
         self.update_images()
 
     def resizeEvent(self, event):
-        self.update_images()
+        self._resize_timer.start()
         super().resizeEvent(event)
         
     def update_images(self):
@@ -949,6 +1546,8 @@ class BlurredBanner(QtWidgets.QWidget):
         
         w, h = self.width(), self.height()
         if w <= 0 or h <= 0: return
+        if self._last_wh == (w, h): return
+        self._last_wh = (w, h)
 
         # Strategy: "Ajustarse al ancho" (Fit Width)
         # We always scale the image to match the widget width.
@@ -962,7 +1561,8 @@ class BlurredBanner(QtWidgets.QWidget):
         scale_factor = w / img_w
         new_h = int(img_h * scale_factor)
         
-        scaled_pix = self._original_pixmap.scaled(w, new_h, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        # Cached, so going back to an earlier size (maximize/restore) skips the smooth filter
+        scaled_pix = _scaled_pixmap(self._original_pixmap, w, new_h)
         
         if new_h >= h:
             # Case A: Image is taller than widget (or equal).
@@ -982,17 +1582,18 @@ class BlurredBanner(QtWidgets.QWidget):
             # We center it vertically and fill background with blur.
             
             # 1. Background: Zoomed blur to fill
-            cover_pix = self._original_pixmap.scaled(w, h, QtCore.Qt.KeepAspectRatioByExpanding, QtCore.Qt.SmoothTransformation)
-            # Crop center of cover
-            cx = (cover_pix.width() - w) // 2
-            cy = (cover_pix.height() - h) // 2
-            bg_cropped = cover_pix.copy(cx, cy, w, h)
+            # Shrink the original straight to a thumbnail that covers the widget's
+            # aspect ratio, crop its center, then stretch it back up (the blur).
+            # Only tiny pixmaps are touched before the final upscale.
+            cover = max(w / img_w, h / img_h)
+            thumb_w = max(20, round(img_w * cover * 20 / w))
+            thumb_h = max(20, round(img_h * cover * 20 / h))
+            thumb = self._original_pixmap.scaled(thumb_w, thumb_h, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+            small = thumb.copy((thumb_w - 20) // 2, (thumb_h - 20) // 2, 20, 20)
             
-            # Blur
-            small = bg_cropped.scaled(20, 20, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
-            blurred = small.scaled(w, h, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
-            
-            self.bg_label.setPixmap(blurred)
+            # Blur: bg_label has scaledContents, so it stretches the 20x20 pixmap itself
+            # (smoothly, caching the result per label size); no full-size copy is made here
+            self.bg_label.setPixmap(small)
             self.bg_label.setGeometry(0, 0, w, h)
             
             # 2. Foreground: Centered vertically
@@ -1000,97 +1601,297 @@ class BlurredBanner(QtWidgets.QWidget):
             self.fg_label.setPixmap(scaled_pix)
             self.fg_label.setGeometry(0, y, w, new_h)
 
+# (owner, repo) -> (fetched_at, parsed details, ETag)
+_DETAILS_CACHE: dict[tuple[str, str], tuple[float, dict, str]] = {}
+DETAILS_CACHE_TTL = 60
+
 def get_remote_details(owner: str, repo: str) -> dict:
     """Fetches details.xml and returns a dict with parsed info."""
+    key = (owner, repo)
+    cached = _DETAILS_CACHE.get(key)
+    if cached and time.time() - cached[0] < DETAILS_CACHE_TTL:
+        return dict(cached[1])
+
     url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/details.xml"
+    headers = {"If-None-Match": cached[2]} if cached and cached[2] else {}
     try:
-        r = requests.get(url, timeout=5)
-        if r.ok:
-            return parse_details_xml(r.text)
+        r = _SESSION.get(url, timeout=5, headers=headers)
+        if r.status_code == 304 and cached:
+            data = cached[1]
+        elif r.ok:
+            data = parse_details_xml(r.text)
+        else:
+            return {}
+        _DETAILS_CACHE[key] = (time.time(), data, r.headers.get('ETag', ''))
+        return dict(data)
     except Exception:
         pass
     return {}
 
+DETAILS_FIELDS = ('name', 'publisher', 'app', 'version', 'platform', 'author')
+XML_FEED_CHUNK = 64 * 1024
+# (field, open tag, close tag) for the plain-text fallback on malformed details.xml
+_DETAILS_TAGS = [(key, f'<{key}>', f'</{key}>') for key in DETAILS_FIELDS]
+# Lowercases ASCII only: str.lower() can change the length of non-ASCII text, which would shift the offsets
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
 def parse_details_xml(content: str) -> dict:
     """Parses details.xml content and returns a dict."""
     data = {}
     try:
-        import xml.etree.ElementTree as ET
-        # Parse the XML content
-        root = ET.fromstring(content)
-        
-        # Extract direct children of root
-        for child in root:
-            tag_name = child.tag.lower()
-            if tag_name in ['name', 'publisher', 'app', 'version', 'platform', 'author']:
-                data[tag_name] = child.text.strip() if child.text else ""
+        # Stream the document through a pull parser and drop each root child
+        # once read, so the full tree is never held in memory.
+        # Stop feeding as soon as every wanted field has been seen.
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        remaining = set(DETAILS_FIELDS)
+        nested = {}  # wanted tags found deeper than the root's children
+        depth = 0
+        for i in range(0, len(content), XML_FEED_CHUNK):
+            parser.feed(content[i:i + XML_FEED_CHUNK])
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                # Extract direct children of root
+                if depth == 1:
+                    tag_name = elem.tag.lower()
+                    if tag_name in remaining:
+                        data[tag_name] = elem.text.strip() if elem.text else ""
+                        remaining.discard(tag_name)
+                    elif tag_name not in DETAILS_FIELDS:
+                        # Wrapper element (e.g. <metadata>): harvest from any depth before clearing
+                        for sub in elem.iter():
+                            sub_tag = sub.tag.lower()
+                            if sub_tag in remaining and sub_tag not in nested:
+                                nested[sub_tag] = sub.text.strip() if sub.text else ""
+                    elem.clear()
+                    if not remaining:
+                        break
+            if not remaining:
+                break
+        else:
+            parser.close()
+        # Top-level tags win; nested ones only fill the gaps
+        for key, value in nested.items():
+            data.setdefault(key, value)
     except Exception:
-        # Fallback to regex if XML parsing fails
+        # Fallback to a case-insensitive tag scan if XML parsing fails
         try:
-            patterns = {
-                'name': r'<name>(.*?)</name>',
-                'publisher': r'<publisher>(.*?)</publisher>',
-                'app': r'<app>(.*?)</app>',
-                'version': r'<version>(.*?)</version>',
-                'platform': r'<platform>(.*?)</platform>',
-                'author': r'<author>(.*?)</author>'
-            }
-            
-            for key, pattern in patterns.items():
-                match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-                if match:
-                    data[key] = match.group(1).strip()
+            lowered = content.translate(_ASCII_LOWER)
+            for key, open_tag, close_tag in _DETAILS_TAGS:
+                start = lowered.find(open_tag)
+                if start == -1:
+                    continue
+                start += len(open_tag)
+                end = lowered.find(close_tag, start)
+                if end != -1:
+                    data[key] = content[start:end].strip()
         except Exception:
             pass
     return data
 
+@functools.lru_cache(maxsize=1)
+def _installed_index() -> dict[str, Path]:
+    """{folder name: path} for every install under Fluthin Apps, listed once.
+    Call _installed_index.cache_clear() after installing or uninstalling."""
+    index = {}
+    try:
+        with os.scandir(_fluthin_apps_dir()) as it:
+            for entry in it:
+                # Dot-prefixed entries are make_staging_dir() leftovers, not installs
+                if not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False):
+                    index[entry.name] = Path(entry.path)
+    except OSError:
+        pass
+    return index
+
 def find_installed_package(publisher: str, app: str, version: str, platform: str) -> Path | None:
     """Checks if a specific package version is installed by exact folder name match."""
-    home = Path.home()
-    if os.name == 'nt':
-        documents = Path(os.path.join(os.environ.get('USERPROFILE',''), 'Documents'))
-    else:
-        documents = home / 'Documents'
-    
-    base_dir = documents / 'Fluthin Apps'
-    if not base_dir.exists():
-        return None
-    
     # Check for exact folder name: {publisher}-{app}-{version}-{platform}
     folder_name = f"{publisher}.{app}.{version}-{platform}"
-    target_path = base_dir / folder_name
-    
-    if target_path.exists() and target_path.is_dir():
-        return target_path
-    return None
+    return _installed_index().get(folder_name)
 
 def find_installed_path(owner: str, repo: str) -> Path | None:
     """Checks if the app is installed in Documents/Fluthin Apps (legacy, loose match)."""
-    home = Path.home()
-    if os.name == 'nt':
-        documents = Path(os.path.join(os.environ.get('USERPROFILE',''), 'Documents'))
-    else:
-        documents = home / 'Documents'
-    
-    base_dir = documents / 'Fluthin Apps'
-    if not base_dir.exists():
-        return None
-        
     # Look for folder containing publisher.app pattern
-    for p in base_dir.iterdir():
-        if p.is_dir() and f".{repo}." in p.name:
-            return p
+    needle = f".{repo}."
+    for name, path in _installed_index().items():
+        if needle in name:
+            return path
     return None
 
+@functools.lru_cache(maxsize=1)
+def _user_cache_dir() -> Path:
+    """Per-user cache for remote assets: %LOCALAPPDATA%\\Fluthin or $XDG_CACHE_HOME/Fluthin."""
+    base = os.environ.get('LOCALAPPDATA') if os.name == 'nt' else os.environ.get('XDG_CACHE_HOME')
+    return Path(base or Path.home() / '.cache') / 'Fluthin'
+
+def cached_get_content(url: str, timeout: float = 6) -> bytes | None:
+    """GETs url, revalidating the copy saved by an earlier call with If-None-Match/If-Modified-Since.
+    Returns the body on 200 (saved when the server sent validators), the saved copy on 304,
+    and None for any other outcome."""
+    stem = _user_cache_dir() / 'http' / hashlib.sha1(url.encode('utf-8')).hexdigest()
+    body_path, meta_path = stem.with_suffix('.bin'), stem.with_suffix('.meta')
+    headers = {}
+    try:
+        etag, _, last_modified = meta_path.read_text(encoding='utf-8').partition('\n')
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    except OSError:
+        pass
+    try:
+        r = _SESSION.get(url, timeout=timeout, headers=headers)
+        if r.status_code == 304:
+            try:
+                return body_path.read_bytes()
+            except OSError:
+                # Validators without a body (cache partly removed): fetch it again in full
+                r = _SESSION.get(url, timeout=timeout)
+    except Exception:
+        return None
+    if not r.ok:
+        return None
+    etag, last_modified = r.headers.get('ETag', ''), r.headers.get('Last-Modified', '')
+    if etag or last_modified:
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            body_path.write_bytes(r.content)
+            meta_path.write_text(f"{etag}\n{last_modified}", encoding='utf-8')
+        except OSError:
+            pass
+    return r.content
+
+def fetch_remote_icon(owner: str, repo: str) -> bytes | None:
+    """Downloads the app icon (.ico, falling back to .png). Returns the raw bytes."""
+    icon_candidates = [
+        f"https://raw.githubusercontent.com/{owner}/{repo}/main/app/app-icon.ico",
+        f"https://raw.githubusercontent.com/{owner}/{repo}/main/app/app-icon.png",
+    ]
+    # Both formats are requested at once, so a missing .ico costs no extra round-trip; .ico wins when it exists.
+    # Each is revalidated against the copy from the last visit, so an unchanged icon is a 304.
+    for content in _FETCH_POOL.map(functools.partial(cached_get_content, timeout=4), icon_candidates):
+        if content is not None:
+            return content
+    return None
+
+def fetch_remote_banner(owner: str, repo: str) -> bytes | None:
+    """Downloads the splash banner. Returns the raw bytes."""
+    banner_url = GITHUB_RAW_TEMPLATE.format(owner=owner, repo=repo)
+    return cached_get_content(banner_url, timeout=5)
+
+def _fetch_readme_response(owner: str, repo: str) -> requests.Response | None:
+    readme_candidates = [
+        f"https://raw.githubusercontent.com/{owner}/{repo}/main/README.md",
+        f"https://raw.githubusercontent.com/{owner}/{repo}/master/README.md",
+    ]
+    # Both branches are requested at once; main wins when it exists
+    for r in fetch_all(readme_candidates, timeout=6):
+        if r is not None and r.ok:
+            return r
+    return None
+
+def fetch_remote_readme(owner: str, repo: str) -> str:
+    """Downloads README.md from the main or master branch."""
+    r = _fetch_readme_response(owner, repo)
+    return r.text if r is not None else "No description available."
+
+def _readme_cache_dir() -> Path:
+    return _user_cache_dir() / 'readme'
+
+def read_cached_readme(owner: str, repo: str) -> tuple[str, str, str] | None:
+    """(html, etag, url) of the README rendered on an earlier visit, or None."""
+    path = _readme_cache_dir() / f"{owner}.{repo}.html"
+    try:
+        etag, _, url = path.with_suffix('.etag').read_text(encoding='utf-8').partition('\n')
+        return path.read_text(encoding='utf-8'), etag, url
+    except OSError:
+        return None
+
+def _save_cached_readme(owner: str, repo: str, html: str, etag: str, url: str):
+    try:
+        cache_dir = _readme_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{owner}.{repo}.html"
+        path.write_text(html, encoding='utf-8')
+        path.with_suffix('.etag').write_text(f"{etag}\n{url}", encoding='utf-8')
+    except OSError:
+        pass
+
+def fetch_remote_readme_html(owner: str, repo: str, cached: tuple[str, str, str] = None) -> str | None:
+    """README rendered to HTML, cached on disk by ETag. With the cached entry from read_cached_readme
+    the request is conditional, and None means the cached HTML is still current."""
+    if cached and cached[1] and cached[2]:
+        r = _SESSION.get(cached[2], timeout=6, headers={"If-None-Match": cached[1]})
+        if r.status_code == 304:
+            return None
+        if r.ok:
+            html = render_readme_html(r.text)
+            if r.headers.get('ETag'):
+                _save_cached_readme(owner, repo, html, r.headers['ETag'], cached[2])
+            return html
+    r = _fetch_readme_response(owner, repo)
+    if r is None:
+        return render_readme_html("No description available.")
+    html = render_readme_html(r.text)
+    if r.headers.get('ETag'):
+        _save_cached_readme(owner, repo, html, r.headers['ETag'], r.url)
+    return html
+
+REMOTE_ASSET_PARTS = ('details', 'icon', 'banner', 'readme')
+
+def _decode_image(data: bytes | None, size: int = None) -> QtGui.QImage | None:
+    """Decodes (and optionally scales to fit size x size) image bytes. QImage is safe off the GUI
+    thread, so only the QPixmap.fromImage upload is left for apply_remote_assets."""
+    if not data:
+        return None
+    img = QtGui.QImage.fromData(data)
+    if img.isNull():
+        return None
+    if size:
+        img = img.scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+    return img
+
+def fetch_remote_assets(owner: str, repo: str, parts: tuple[str, ...] = REMOTE_ASSET_PARTS, readme_cache=None) -> dict:
+    """Blocking fetch of the requested parts InstallWindow shows for a remote repo. Meant to run off the GUI thread."""
+    assets = {}
+    if 'details' in parts:
+        assets['details'] = get_remote_details(owner, repo)
+    if 'icon' in parts:
+        try:
+            assets['icon'] = _decode_image(fetch_remote_icon(owner, repo), 72)
+        except Exception:
+            pass
+    if 'banner' in parts:
+        try:
+            assets['banner'] = _decode_image(fetch_remote_banner(owner, repo))
+        except Exception:
+            pass
+    if 'readme' in parts:
+        try:
+            if HAS_MARKDOWN:
+                # Rendered here rather than on the GUI thread; None: readme_cache is current
+                html = fetch_remote_readme_html(owner, repo, readme_cache)
+                if html is not None:
+                    assets['readme_html'] = html
+            else:
+                assets['readme'] = fetch_remote_readme(owner, repo)
+        except Exception as e:
+            assets['readme_error'] = str(e)
+    return assets
+
 class InstallWindow(QtWidgets.QWidget):
-    def __init__(self, repo: str, owner: str, local_file_path: str = None, parent=None):
+    def __init__(self, repo: str, owner: str, local_file_path: str | os.PathLike = None, parent=None):
         super().__init__(parent)
         self.repo = repo
         self.owner = owner
         self.local_file_path = local_file_path
         self.shortname = repo
         self.app_name = repo # Default fallback
-        self.temp_extract_dir = None # To clean up later if needed
+        self.temp_extract_dir = None # Lives under _temp_root(), removed at exit
+        self.releases_future = None # Releases API response, requested together with the assets
         
         # Metadata placeholders
         self.meta_publisher = owner
@@ -1142,8 +1943,9 @@ class InstallWindow(QtWidgets.QWidget):
         self.icon_label.setFixedSize(72, 72)
         self.icon_label.setStyleSheet("background: #f1f3f4; border-radius: 12px; border: 1px solid #dadce0;")
         self.icon_label.setScaledContents(True)
-        if os.path.exists(DEFAULT_ICON):
-             self.icon_label.setPixmap(QtGui.QPixmap(DEFAULT_ICON))
+        default_icon = _cached_pixmap(DEFAULT_ICON)
+        if default_icon is not None:
+             self.icon_label.setPixmap(default_icon)
         h_layout.addWidget(self.icon_label)
         
         # Text Info
@@ -1206,15 +2008,21 @@ class InstallWindow(QtWidgets.QWidget):
         left_layout.addWidget(desc_lbl)
         
         if HAS_MARKDOWN:
-            self.readme_view = QWebEngineView()
-            self.readme_view.setStyleSheet("background: white;")
-            self.readme_view.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+            # The QWebEngineView (and the Chromium process behind it) is only created by
+            # show_readme_html once there is HTML to show; a label holds its place until then
+            self.readme_view = None
+            self.readme_placeholder = QtWidgets.QLabel("Cargando README…")
+            self.readme_placeholder.setAlignment(QtCore.Qt.AlignCenter)
+            self.readme_placeholder.setStyleSheet("color: #5f6368; background: white;")
+            self.readme_stack = QtWidgets.QStackedWidget()
+            self.readme_stack.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+            self.readme_stack.addWidget(self.readme_placeholder)
+            left_layout.addWidget(self.readme_stack)
         else:
             self.readme_view = QtWidgets.QTextEdit()
             self.readme_view.setReadOnly(True)
             self.readme_view.setStyleSheet("border: none; background: #ffffff;")
-            
-        left_layout.addWidget(self.readme_view)
+            left_layout.addWidget(self.readme_view)
         c_layout.addWidget(left_panel, 65)
         
         # Right: Progress & Logs
@@ -1237,6 +2045,13 @@ class InstallWindow(QtWidgets.QWidget):
         self.log.setReadOnly(True)
         self.log.setObjectName("LogArea")
         r_layout.addWidget(self.log)
+
+        # Log lines are buffered and appended in one go, at most every 50 ms
+        self._log_buffer = []
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self.flush_log)
         
         c_layout.addWidget(right_panel, 35)
         
@@ -1254,13 +2069,21 @@ class InstallWindow(QtWidgets.QWidget):
             
         self.share_btn.clicked.connect(self.on_share)
         
-        QtCore.QTimer.singleShot(100, self.load_remote_assets)
+        # Local packages carry everything they show; only repos need the network
+        if not self.local_file_path:
+            # Open the TLS connection to raw.githubusercontent.com while the window is built,
+            # so the first asset request finds it waiting in the session pool
+            _FETCH_POOL.submit(_SESSION.head, GITHUB_RAW_ROOT, timeout=2)
+            QtCore.QTimer.singleShot(100, self.load_remote_assets)
 
         # Offline Mode Adjustments (UI Updates)
         if self.local_file_path:
             # Enable share button for local packages if we have author info
             # self.share_btn.setVisible(False)  # Keep it visible now
             self.meta_lbl.setText(f"{self.meta_publisher} (Local)")
+            if HAS_MARKDOWN:
+                # No README is fetched for local packages, so nothing would replace the placeholder
+                self.readme_placeholder.setText("Sin descripción")
             self.ver_lbl.setText(f"Versión: {self.meta_version} | Plataforma: {self.meta_platform}")
             
             # Check Compatibility
@@ -1277,13 +2100,20 @@ class InstallWindow(QtWidgets.QWidget):
     def load_local_package_metadata(self):
         """Extracts details.xml from the local package to populate metadata."""
         try:
-            self.temp_extract_dir = Path(tempfile.mkdtemp(prefix="Fluthin_meta_"))
             with zipfile.ZipFile(self.local_file_path, 'r') as z:
-                # Try to extract details.xml
-                if "details.xml" in z.namelist():
-                    z.extract("details.xml", self.temp_extract_dir)
-                    details_path = self.temp_extract_dir / "details.xml"
-                    content = details_path.read_text(encoding='utf-8')
+                # Classify every member in a single pass over the central directory
+                details_info = None
+                assets_to_extract = []
+                for zi in z.infolist():
+                    name = zi.filename
+                    if name == "details.xml":
+                        details_info = zi
+                    elif name.startswith(("assets/", "app/")):
+                        assets_to_extract.append(zi)
+
+                # details.xml is parsed straight from the archive, never written to disk
+                if details_info is not None:
+                    content = z.read(details_info).decode('utf-8')
                     data = parse_details_xml(content)
                     
                     self.app_name = data.get('name', self.app_name)
@@ -1297,13 +2127,9 @@ class InstallWindow(QtWidgets.QWidget):
                     if data.get('publisher'): self.owner = data.get('publisher')
                     if data.get('app'): self.repo = data.get('app')
                 
-                # Extract assets if they exist
-                assets_to_extract = []
-                for f in z.namelist():
-                    if f.startswith("assets/") or f.startswith("app/"):
-                        assets_to_extract.append(f)
-                
+                # Extract assets if they exist; the temp dir is only created when there is something to put in it
                 if assets_to_extract:
+                    self.temp_extract_dir = make_temp_dir("meta_")
                     z.extractall(self.temp_extract_dir, members=assets_to_extract)
             
             # Check Platform Compatibility
@@ -1319,39 +2145,44 @@ class InstallWindow(QtWidgets.QWidget):
         except Exception as e:
             print(f"Error reading local package metadata: {e}")
 
-    def load_local_assets_to_ui(self):
-        """Loads icons and banner from the extracted temp dir."""
-        if not self.temp_extract_dir: return
+    def load_local_assets_to_ui(self, root: Path = None) -> set[str]:
+        """Loads icons and banner from root (the extracted temp dir by default). Returns the parts it found."""
+        root = root or self.temp_extract_dir
+        loaded = set()
+        if not root: return loaded
         
         # Icon
-        icon_path = self.temp_extract_dir / "app" / "app-icon.ico"
+        icon_path = root / "app" / "app-icon.ico"
         if not icon_path.exists():
-             icon_path = self.temp_extract_dir / "app" / "app-icon.png"
+             icon_path = root / "app" / "app-icon.png"
         
         if icon_path.exists():
             pix = QtGui.QPixmap(str(icon_path))
             self.icon_label.setPixmap(pix.scaled(72, 72, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
+            loaded.add('icon')
             
         # Banner
-        banner_path = self.temp_extract_dir / "assets" / "splash.png"
+        banner_path = root / "assets" / "splash.png"
         if banner_path.exists():
             pix = QtGui.QPixmap(str(banner_path))
             self.banner.setPixmap(pix)
-
-    def closeEvent(self, event):
-        # Cleanup temp dir
-        if self.temp_extract_dir and self.temp_extract_dir.exists():
-            try:
-                shutil.rmtree(self.temp_extract_dir)
-            except:
-                pass
-        super().closeEvent(event)
+            loaded.add('banner')
+        return loaded
 
     def log_msg(self, s: str):
-        self.log.append(s)
-        cursor = self.log.textCursor()
-        cursor.movePosition(QtGui.QTextCursor.End)
-        self.log.setTextCursor(cursor)
+        self._log_buffer.append(s)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def flush_log(self):
+        if not self._log_buffer:
+            return
+        # One append per line: QTextEdit decides plain vs rich text per call, and a joined batch
+        # containing markup would be rendered as one HTML paragraph, losing its line breaks
+        for line in self._log_buffer:
+            self.log.append(line)
+        self._log_buffer.clear()
+        self.log.moveCursor(QtGui.QTextCursor.End)
 
     def set_progress(self, val: int):
         self.progress.setValue(val)
@@ -1360,27 +2191,53 @@ class InstallWindow(QtWidgets.QWidget):
         if self.local_file_path:
             return # Skip remote assets for local files
 
-        # 1. Try Local details.xml if installed
+        # 1. Try Local details.xml (and the installed icon/banner) if installed
+        local_parts = set()
         if self.installed_path:
+            local_parts = self.load_local_assets_to_ui(self.installed_path)
             local_details = self.installed_path / "details.xml"
             if local_details.exists():
                 try:
-                    content = local_details.read_text(encoding='utf-8')
-                    name_match = re.search(r'<name>(.*?)</name>', content, re.IGNORECASE)
-                    if name_match:
-                        self.app_name = name_match.group(1)
-                        self.title_lbl.setText(self.app_name)
-                        self.title_bar.title_label.setText(f"Ejecutar {self.app_name}")
-                        # We can return early or still try to fetch other assets?
-                        # Let's continue to fetch icons/banner if they are not local (we don't save those yet)
+                    data = parse_details_xml(local_details.read_text(encoding='utf-8'))
+                    if data:
+                        # Same path as remote details: name, meta labels and compatibility
+                        self.apply_remote_assets({'details': data})
+                        local_parts.add('details')
+                    # The icon/banner shipped in the install folder were loaded above;
+                    # only whatever is still missing is fetched below
                 except Exception:
                     pass
 
         # 2. Fetch remote details.xml if we still don't have a custom name or just to refresh
         # (Only if we didn't find it locally or we want to be sure)
         # Actually, if we found it locally, we trust it.
-        if self.app_name == self.repo:
-            details = get_remote_details(self.owner, self.repo)
+        # Each part is fetched by its own worker on the thread pool, so the UI waits for the
+        # slowest request rather than the sum; results arrive through apply_remote_assets
+        # The releases list the install needs is requested in the same round, so pressing
+        # Instalar does not start with another API round trip. Installed apps show Ejecutar
+        # instead, and would only spend the API rate limit on a response nobody reads
+        if self.installed_path is None:
+            api = GITHUB_RELEASES_API.format(owner=self.owner, repo=self.repo)
+            self.releases_future = _FETCH_POOL.submit(_SESSION.get, api, timeout=15)
+        parts = REMOTE_ASSET_PARTS if self.app_name == self.repo else REMOTE_ASSET_PARTS[1:]
+        parts = [part for part in parts if part not in local_parts]
+        if HAS_MARKDOWN and 'readme' not in parts and self.readme_view is None:
+            self.readme_placeholder.setText("Sin descripción")
+        pool = QtCore.QThreadPool.globalInstance()
+        # A README rendered on an earlier visit is shown at once and only revalidated
+        readme_cache = read_cached_readme(self.owner, self.repo) if HAS_MARKDOWN and 'readme' in parts else None
+        if readme_cache:
+            self.show_readme_html(readme_cache[0])
+        for part in parts:
+            worker = IOWorker(fetch_remote_assets, self.owner, self.repo, (part,),
+                              readme_cache=readme_cache if part == 'readme' else None)
+            worker.signals.finished.connect(self.apply_remote_assets)
+            pool.start(worker)
+
+    def apply_remote_assets(self, assets: dict):
+        """Applies a (possibly partial) result of fetch_remote_assets to the UI (runs on the GUI thread)."""
+        if 'details' in assets:
+            details = assets['details']
             if details.get('name'):
                 self.app_name = details['name']
                 self.title_lbl.setText(self.app_name)
@@ -1410,60 +2267,36 @@ class InstallWindow(QtWidgets.QWidget):
                 # We don't show a popup here to avoid spamming if just viewing, but the UI is clear.
 
         # Icon
-        try:
-            icon_url = f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/main/app/app-icon.ico"
-            r = requests.get(icon_url, timeout=4)
-            if r.ok:
-                pix = QtGui.QPixmap()
-                pix.loadFromData(r.content)
-                self.icon_label.setPixmap(pix.scaled(72, 72, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-            else:
-                icon_url_png = f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/main/app/app-icon.png"
-                r = requests.get(icon_url_png, timeout=4)
-                if r.ok:
-                    pix = QtGui.QPixmap()
-                    pix.loadFromData(r.content)
-                    self.icon_label.setPixmap(pix.scaled(72, 72, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-        except Exception:
-            pass
+        if assets.get('icon') is not None:
+            self.icon_label.setPixmap(QtGui.QPixmap.fromImage(assets['icon']))
 
         # Banner
-        try:
-            banner_url = GITHUB_RAW_TEMPLATE.format(owner=self.owner, repo=self.repo)
-            r = requests.get(banner_url, timeout=5)
-            if r.ok:
-                pix = QtGui.QPixmap()
-                pix.loadFromData(r.content)
-                self.banner.setPixmap(pix)
-        except Exception:
-            pass
+        if assets.get('banner') is not None:
+            self.banner.setPixmap(QtGui.QPixmap.fromImage(assets['banner']))
 
         # Readme
-        try:
-            readme_candidates = [
-                f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/main/README.md",
-                f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/master/README.md",
-            ]
-            text = ""
-            for url in readme_candidates:
-                r = requests.get(url, timeout=6)
-                if r.ok:
-                    text = r.text
-                    break
-            
-            if not text:
-                text = "No description available."
-
-            if HAS_MARKDOWN and isinstance(self.readme_view, QWebEngineView):
-                html = markdown.markdown(text)
-                style = "<style>body { font-family: Roboto, sans-serif; color: #202124; line-height: 1.6; } a { color: #ff6d00; text-decoration: none; } code { background: #f1f3f4; padding: 2px 4px; border-radius: 4px; } h1, h2, h3 { color: #202124; }</style>"
-                self.readme_view.setHtml(style + html)
+        if 'readme_error' in assets:
+            if not HAS_MARKDOWN:
+                self.readme_view.setPlainText(f"Error loading details: {assets['readme_error']}")
+            elif self.readme_view is None:
+                self.readme_placeholder.setText("No se pudo cargar el README.")
+        elif 'readme_html' in assets:
+            self.show_readme_html(assets['readme_html'])
+        elif 'readme' in assets:
+            text = assets['readme']
+            if HAS_MARKDOWN:
+                self.show_readme_html(render_readme_html(text))
             else:
                 self.readme_view.setPlainText(text)
-                
-        except Exception as e:
-            if not HAS_MARKDOWN:
-                self.readme_view.setPlainText(f"Error loading details: {e}")
+
+    def show_readme_html(self, html: str):
+        """Shows rendered README HTML, creating the QWebEngineView on first use."""
+        if self.readme_view is None:
+            self.readme_view = QWebEngineView()
+            self.readme_view.setStyleSheet("background: white;")
+            self.readme_stack.addWidget(self.readme_view)
+            self.readme_stack.setCurrentWidget(self.readme_view)
+        self.readme_view.setHtml(html)
 
     def on_share(self):
         # Determine the GitHub URL
@@ -1475,7 +2308,7 @@ class InstallWindow(QtWidgets.QWidget):
             long_url = f"https://github.com/{self.owner}/{self.repo}"
         
         try:
-            r = requests.get(f"https://is.gd/create.php?format=simple&url={long_url}", timeout=15)
+            r = _SESSION.get(f"https://is.gd/create.php?format=simple&url={long_url}", timeout=15)
             if r.ok:
                 short_url = r.text.strip()
             else:
@@ -1502,9 +2335,9 @@ class InstallWindow(QtWidgets.QWidget):
         if reply == QtWidgets.QMessageBox.Yes:
             try:
                 # 1. Remove desktop shortcuts
-                desktop = Path.home() / 'Desktop'
+                desktop = _desktop_dir()
                 shortcut_name = self.app_name if self.app_name else f"{self.owner}.{self.shortname}"
-                shortcut_name = re.sub(r'[<>:"/\\|?*]', '', shortcut_name)
+                shortcut_name = sanitize_shortcut_name(shortcut_name)
                 
                 # Try to remove various shortcut formats
                 for ext in ['.lnk', '.url', '.desktop', '.command']:
@@ -1519,6 +2352,7 @@ class InstallWindow(QtWidgets.QWidget):
                 # 2. Remove application folder
                 if self.installed_path and self.installed_path.exists():
                     shutil.rmtree(self.installed_path, ignore_errors=False)
+                    _installed_index.cache_clear()
                     self.log_msg(f"Carpeta eliminada: {self.installed_path}")
                 
                 # 3. Update UI state
@@ -1548,12 +2382,11 @@ class InstallWindow(QtWidgets.QWidget):
 
     def on_execute(self):
         if not self.installed_path: return
-        exe_path = find_executable(self.installed_path, self.shortname)
+        # Recorded at install time; older installs fall back to searching
+        exe_path = remembered_executable(self.installed_path) or find_executable(self.installed_path, self.shortname)
         if not exe_path:
             # Fallback scan
-            for p in self.installed_path.rglob('*.exe'):
-                exe_path = p
-                break
+            exe_path = find_first_exe(self.installed_path)
         
         if exe_path:
             try:
@@ -1570,7 +2403,10 @@ class InstallWindow(QtWidgets.QWidget):
         self.progress.setValue(0)
         self.log_msg("Iniciando instalación...")
         
-        worker = InstallWorker(self.repo, self.owner, self.shortname, self.app_name, self.local_file_path, self.meta_app, self.meta_publisher)
+        worker = InstallWorker(self.repo, self.owner, self.shortname, self.app_name, self.local_file_path, self.meta_app, self.meta_publisher,
+                               self.releases_future)
+        # The prefetched response serves one attempt only: a retry must not get a cached error again
+        self.releases_future = None
         worker.signals.log.connect(self.log_msg)
         worker.signals.progress.connect(self.set_progress)
         worker.signals.done.connect(self.install_finished)
@@ -1586,6 +2422,7 @@ class InstallWindow(QtWidgets.QWidget):
         self.install_btn.setEnabled(True)
         self.progress.setValue(100 if success else 0)
         if success:
+            _installed_index.cache_clear()
             QtWidgets.QMessageBox.information(self, "Éxito", f"Instalación completada correctamente.\nUbicación: {target_dir}")
             self.installed_path = Path(target_dir)
             self.install_btn.setText("Ejecutar")
@@ -1600,8 +2437,30 @@ class WorkerSignals(QtCore.QObject):
     done = QtCore.pyqtSignal(bool, str)
     ask_open_releases = QtCore.pyqtSignal(str)
 
+class IOSignals(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int)
+    finished = QtCore.pyqtSignal(object)
+    error = QtCore.pyqtSignal(str)
+
+class IOWorker(QtCore.QRunnable):
+    """Runs a blocking callable on the thread pool and emits its result on the GUI thread."""
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = IOSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as ex:
+            self.signals.error.emit(str(ex))
+        else:
+            self.signals.finished.emit(result)
+
 class InstallWorker(QtCore.QRunnable):
-    def __init__(self, repo: str, owner: str, shortname: str, app_name: str, local_file_path: str = None, meta_app_id: str = None, meta_publisher: str = None):
+    def __init__(self, repo: str, owner: str, shortname: str, app_name: str, local_file_path: str | os.PathLike = None, meta_app_id: str = None, meta_publisher: str = None, releases_future=None):
         super().__init__()
         self.repo = repo
         self.owner = owner
@@ -1610,6 +2469,7 @@ class InstallWorker(QtCore.QRunnable):
         self.local_file_path = local_file_path
         self.meta_app_id = meta_app_id
         self.meta_publisher = meta_publisher
+        self.releases_future = releases_future
         self.signals = WorkerSignals()
 
     def run(self):
@@ -1620,10 +2480,9 @@ class InstallWorker(QtCore.QRunnable):
                 
                 # Parse filename for version/platform
                 filename = os.path.basename(self.local_file_path)
-                match = re.match(r'^(.+?)-([0-9A-Za-z\.\-_]+)-([0-9A-Za-z\._\-]+)\.iflapp$', filename, re.IGNORECASE)
-                if match:
-                    version = match.group(2)
-                    platformstr = match.group(3)
+                parts = _parse_iflapp(filename)
+                if parts:
+                    _, version, platformstr = parts
                 else:
                     version = "local"
                     platformstr = "unknown"
@@ -1635,36 +2494,44 @@ class InstallWorker(QtCore.QRunnable):
                      return
 
                 self.signals.log.emit("Extrayendo archivos...")
-                tmpdir = Path(tempfile.mkdtemp(prefix="Fluthin_iflapp_"))
-                extract_dir = tmpdir / "extract"
-                extract_dir.mkdir(parents=True, exist_ok=True)
-                
-                extract_archive(self.local_file_path, str(extract_dir))
-                
-                self.signals.log.emit("Instalando...")
-                # Use meta values if available, otherwise fallback to defaults
-                publisher_to_use = self.meta_publisher if self.meta_publisher else self.owner
-                app_id_to_use = self.meta_app_id if self.meta_app_id else self.shortname
-                dest_base = create_documents_app_folder(publisher_to_use, app_id_to_use, version, platformstr)
-                move_install_tree(extract_dir, dest_base)
+                # Extract next to the install folder so moving it into place is a rename
+                staging = make_staging_dir()
+                try:
+                    extract_archive(self.local_file_path, str(staging))
+                    
+                    self.signals.log.emit("Instalando...")
+                    # Use meta values if available, otherwise fallback to defaults
+                    publisher_to_use = self.meta_publisher if self.meta_publisher else self.owner
+                    app_id_to_use = self.meta_app_id if self.meta_app_id else self.shortname
+                    dest_base = create_documents_app_folder(publisher_to_use, app_id_to_use, version, platformstr)
+                    move_install_tree(staging, dest_base)
+                finally:
+                    # Staging also holds any replaced folders; done is emitted without waiting for it
+                    discard_tree(staging)
                 
                 # Shortcut logic
-                exe_path = find_executable(dest_base, self.shortname)
+                exe_path = find_installed_executable(self.local_file_path, dest_base, self.shortname)
                 if exe_path:
-                    desktop = Path.home() / 'Desktop'
+                    desktop = _desktop_dir()
                     shortcut_name = self.app_name if self.app_name else self.shortname
-                    shortcut_name = re.sub(r'[<>:"/\\|?*]', '', shortcut_name)
+                    shortcut_name = sanitize_shortcut_name(shortcut_name)
                     create_shortcut(desktop, exe_path, shortcut_name)
                     self.signals.log.emit(f"Acceso directo creado: {shortcut_name}")
                 
-                shutil.rmtree(tmpdir, ignore_errors=True)
                 self.signals.done.emit(True, str(dest_base))
                 return
 
             # Online Mode
             self.signals.log.emit(f"Consultando GitHub API ({self.owner}/{self.repo})...")
-            api = GITHUB_RELEASES_API.format(owner=self.owner, repo=self.repo)
-            r = requests.get(api, timeout=15)
+            r = None
+            if self.releases_future is not None:
+                try:
+                    r = self.releases_future.result()
+                except Exception:
+                    r = None # The early request failed; ask again below
+            if r is None:
+                api = GITHUB_RELEASES_API.format(owner=self.owner, repo=self.repo)
+                r = _SESSION.get(api, timeout=15)
             if not r.ok:
                 self.signals.log.emit(f"Error API: {r.status_code}")
                 self.signals.ask_open_releases.emit(f"https://github.com/{self.owner}/{self.repo}/releases")
@@ -1692,91 +2559,200 @@ class InstallWorker(QtCore.QRunnable):
 
             self.signals.log.emit(f"Descargando: {asset['name']} ({version})")
             
-            tmpdir = Path(tempfile.mkdtemp(prefix="Fluthin_dl_"))
-            downloaded = tmpdir / asset['name']
-            
+            # Removed on the way out, also when the download or the install fails. mkdtemp rather
+            # than TemporaryDirectory: ignore_cleanup_errors needs Python 3.10
+            td = tempfile.mkdtemp(prefix="dl_", dir=_temp_root())
+            details_future = None
             try:
-                download_file(asset['browser_download_url'], str(downloaded), lambda p: self.signals.progress.emit(p))
-            except Exception as e:
-                self.signals.log.emit(f"Error descarga: {e}")
-                self.signals.done.emit(False, "")
-                return
-
-            self.signals.log.emit("Extrayendo...")
-            extract_dir = tmpdir / "extract"
-            extract_dir.mkdir(parents=True, exist_ok=True)
-            extract_archive(str(downloaded), str(extract_dir))
+                tmpdir = Path(td)
+                downloaded = tmpdir / asset['name']
             
-            self.signals.log.emit("Instalando...")
-            # Use meta values if available, otherwise fallback to defaults
-            publisher_to_use = self.meta_publisher if self.meta_publisher else self.owner
-            app_id_to_use = self.meta_app_id if self.meta_app_id else self.shortname
-            dest_base = create_documents_app_folder(publisher_to_use, app_id_to_use, version or "v1", platformstr or "unknown")
-            move_install_tree(extract_dir, dest_base)
-            
-            # Download details.xml to install folder for future reference
-            try:
+                # Use meta values if available, otherwise fallback to defaults
+                publisher_to_use = self.meta_publisher if self.meta_publisher else self.owner
+                app_id_to_use = self.meta_app_id if self.meta_app_id else self.shortname
+                install_args = (publisher_to_use, app_id_to_use, version or "v1", platformstr or "unknown")
+
+                # Fetch details.xml (kept for future reference) while the archive is downloaded and extracted.
+                # A copy saved by an earlier install is revalidated with its ETag instead of re-downloaded.
                 details_url = f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/main/details.xml"
-                r = requests.get(details_url, timeout=5)
-                if r.ok:
-                    (dest_base / "details.xml").write_bytes(r.content)
-            except Exception:
-                pass
+                details_tmp = tmpdir / "details.xml"
+                saved_details = read_saved_details_xml(documents_app_folder_path(*install_args))
+                details_future = _FETCH_POOL.submit(download_details_xml, details_url, str(details_tmp),
+                                                    saved_details[0] if saved_details else None)
 
-            # Shortcut logic
-            exe_path = find_executable(dest_base, self.shortname)
-            if exe_path:
-                desktop = Path.home() / 'Desktop'
-                # Use app_name for shortcut
-                shortcut_name = self.app_name if self.app_name else f"{self.owner}.{self.shortname}"
-                # Sanitize filename
-                shortcut_name = re.sub(r'[<>:"/\\|?*]', '', shortcut_name)
-                create_shortcut(desktop, exe_path, shortcut_name)
-                self.signals.log.emit(f"Acceso directo creado: {shortcut_name}")
+                try:
+                    archive = download_file(asset['browser_download_url'], str(downloaded),
+                                            lambda p: self.signals.progress.emit(p), IN_MEMORY_ARCHIVE_MAX)
+                except Exception as e:
+                    self.signals.log.emit(f"Error descarga: {e}")
+                    self.signals.done.emit(False, "")
+                    return
+
+                self.signals.log.emit("Extrayendo...")
+                # Extract next to the install folder so moving it into place is a rename
+                staging = make_staging_dir()
+                try:
+                    extract_archive(archive, str(staging), asset['name'])
+                
+                    self.signals.log.emit("Instalando...")
+                    dest_base = create_documents_app_folder(*install_args)
+                    move_install_tree(staging, dest_base)
+                finally:
+                    # Staging also holds any replaced folders; done is emitted without waiting for it
+                    discard_tree(staging)
             
-            shutil.rmtree(tmpdir, ignore_errors=True)
+                # Shortcut logic. It runs before the wait on details_future below, so a
+                # details.xml request that is still in flight overlaps with it
+                exe_path = find_installed_executable(archive, dest_base, self.shortname)
+                if exe_path:
+                    desktop = _desktop_dir()
+                    # Use app_name for shortcut
+                    shortcut_name = self.app_name if self.app_name else f"{self.owner}.{self.shortname}"
+                    # Sanitize filename
+                    shortcut_name = sanitize_shortcut_name(shortcut_name)
+                    create_shortcut(desktop, exe_path, shortcut_name)
+                    self.signals.log.emit(f"Acceso directo creado: {shortcut_name}")
+
+                # Place the details.xml fetched during extraction in the install folder
+                try:
+                    result = details_future.result(timeout=6)
+                    if result:
+                        shutil.move(str(details_tmp), str(dest_base / "details.xml"))
+                        if os.path.exists(str(details_tmp) + ".etag"):
+                            shutil.move(str(details_tmp) + ".etag", str(dest_base / "details.xml.etag"))
+                    elif result is None and saved_details:
+                        # 304: the package may have overwritten details.xml, so restore the saved copy
+                        etag, content = saved_details
+                        (dest_base / "details.xml").write_bytes(content)
+                        (dest_base / "details.xml.etag").write_text(etag, encoding='utf-8')
+                    elif result is False:
+                        self.signals.log.emit("details.xml omitido: la respuesta no es un XML válido")
+                except FutureTimeoutError:
+                    self.signals.log.emit("No se pudo obtener details.xml: tiempo de espera agotado")
+                except Exception as e:
+                    self.signals.log.emit(f"No se pudo obtener details.xml: {e}")
+            finally:
+                if details_future is None or details_future.done() or details_future.cancel():
+                    shutil.rmtree(td, ignore_errors=True)
+                else:
+                    # The fetch is still writing into td; remove it once that request ends
+                    details_future.add_done_callback(lambda _f: shutil.rmtree(td, ignore_errors=True))
+
             self.signals.done.emit(True, str(dest_base))
             
         except Exception as ex:
             self.signals.log.emit(f"Error crítico: {ex}")
             self.signals.done.emit(False, "")
 
+# Planned application reconfiguration (SHTDN_REASON_FLAG_PLANNED | MAJOR_APPLICATION | MINOR_RECONFIG)
+_SHTDN_REASON_APP_RECONFIG = 0x80000000 | 0x00040000 | 0x00000004
+
+@functools.lru_cache(maxsize=1)
+def _shutdown_api():
+    """(advapi32, kernel32) with prototypes for the calls below. Without argtypes ctypes passes
+    Python ints as C int, which cannot hold the 64-bit pseudo-handle GetCurrentProcess returns."""
+    from ctypes import wintypes
+    advapi = ctypes.WinDLL("advapi32", use_last_error=True)
+    kernel = ctypes.WinDLL("kernel32", use_last_error=True)
+    prototypes = (
+        (kernel.GetCurrentProcess, wintypes.HANDLE, []),
+        (kernel.CloseHandle, wintypes.BOOL, [wintypes.HANDLE]),
+        (advapi.OpenProcessToken, wintypes.BOOL, [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE)]),
+        (advapi.LookupPrivilegeValueW, wintypes.BOOL, [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p]),
+        (advapi.AdjustTokenPrivileges, wintypes.BOOL,
+         [wintypes.HANDLE, wintypes.BOOL, ctypes.c_void_p, wintypes.DWORD, ctypes.c_void_p, ctypes.c_void_p]),
+        (advapi.InitiateSystemShutdownExW, wintypes.BOOL,
+         [wintypes.LPWSTR, wintypes.LPWSTR, wintypes.DWORD, wintypes.BOOL, wintypes.BOOL, wintypes.DWORD]),
+        (advapi.AbortSystemShutdownW, wintypes.BOOL, [wintypes.LPWSTR]),
+    )
+    for fn, restype, argtypes in prototypes:
+        fn.restype, fn.argtypes = restype, argtypes
+    return advapi, kernel
+
+def _enable_shutdown_privilege() -> bool:
+    """Enables SeShutdownPrivilege on this process token (required by InitiateSystemShutdownExW)."""
+    from ctypes import wintypes
+
+    class LUID(ctypes.Structure):
+        _fields_ = [("LowPart", wintypes.DWORD), ("HighPart", wintypes.LONG)]
+
+    class LUID_AND_ATTRIBUTES(ctypes.Structure):
+        _fields_ = [("Luid", LUID), ("Attributes", wintypes.DWORD)]
+
+    class TOKEN_PRIVILEGES(ctypes.Structure):
+        _fields_ = [("PrivilegeCount", wintypes.DWORD), ("Privileges", LUID_AND_ATTRIBUTES * 1)]
+
+    TOKEN_ADJUST_PRIVILEGES, TOKEN_QUERY, SE_PRIVILEGE_ENABLED = 0x20, 0x08, 0x02
+    advapi, kernel = _shutdown_api()
+
+    token = wintypes.HANDLE()
+    if not advapi.OpenProcessToken(kernel.GetCurrentProcess(), TOKEN_ADJUST_PRIVILEGES | TOKEN_QUERY, ctypes.byref(token)):
+        return False
+    try:
+        luid = LUID()
+        if not advapi.LookupPrivilegeValueW(None, "SeShutdownPrivilege", ctypes.byref(luid)):
+            return False
+        tp = TOKEN_PRIVILEGES(1, (LUID_AND_ATTRIBUTES * 1)(LUID_AND_ATTRIBUTES(luid, SE_PRIVILEGE_ENABLED)))
+        ctypes.set_last_error(0)
+        if not advapi.AdjustTokenPrivileges(token, False, ctypes.byref(tp), 0, None, None):
+            return False
+        # AdjustTokenPrivileges "succeeds" with ERROR_NOT_ALL_ASSIGNED when the privilege is missing
+        return ctypes.get_last_error() == 0
+    finally:
+        kernel.CloseHandle(token)
+
 def restart_pc_delayed(seconds: int = 60):
     """Schedule a PC restart after specified seconds."""
+    if not _IS_WINDOWS:
+        return False
+    message = f'Reiniciando en {seconds} segundos para aplicar cambios de registro de Fluthin Handler...'
+    # Ask the kernel directly instead of spawning shutdown.exe
     try:
-        if platform.system().lower() == 'windows':
-            subprocess.run(['shutdown', '/r', '/t', str(seconds), '/c', 
-                          f'Reiniciando en {seconds} segundos para aplicar cambios de registro de Fluthin Handler...'], 
-                          check=False)
-            return True
+        if _enable_shutdown_privilege():
+            advapi, _ = _shutdown_api()
+            if advapi.InitiateSystemShutdownExW(None, message, int(seconds), False, True, _SHTDN_REASON_APP_RECONFIG):
+                return True
+    except Exception:
+        pass
+    try:
+        subprocess.run(['shutdown', '/r', '/t', str(seconds), '/c', message], check=False)
+        return True
     except Exception:
         pass
     return False
 
 def cancel_restart():
     """Cancel a scheduled restart."""
+    if not _IS_WINDOWS:
+        return False
     try:
-        if platform.system().lower() == 'windows':
-            subprocess.run(['shutdown', '/a'], check=False)
+        if _enable_shutdown_privilege() and _shutdown_api()[0].AbortSystemShutdownW(None):
             return True
     except Exception:
         pass
+    try:
+        subprocess.run(['shutdown', '/a'], check=False)
+        return True
+    except Exception:
+        pass
     return False
 
-def handle_iflapp_file(file_path: str):
+def handle_iflapp_file(file_path: str | os.PathLike):
     """Handle .iflapp file as offline installer package."""
     try:
-        file_path = os.path.abspath(file_path)
-        if not os.path.exists(file_path):
-            QtWidgets.QMessageBox.critical(None, "Error", f"Archivo no encontrado: {file_path}")
+        # resolve(strict=True) makes the path absolute and checks it exists in one go
+        try:
+            package = Path(file_path).resolve(strict=True)
+        except FileNotFoundError:
+            QtWidgets.QMessageBox.critical(None, "Error", f"Archivo no encontrado: {os.path.abspath(file_path)}")
             return None
         
-        if not file_path.lower().endswith('.iflapp'):
+        if package.suffix.lower() != '.iflapp':
             QtWidgets.QMessageBox.critical(None, "Error", "El archivo debe tener extensión .iflapp")
             return None
             
         # Open unified InstallWindow
-        w = InstallWindow(repo="", owner="", local_file_path=file_path)
+        w = InstallWindow(repo="", owner="", local_file_path=package)
         w.show()
         return w
         
@@ -1784,25 +2760,42 @@ def handle_iflapp_file(file_path: str):
         QtWidgets.QMessageBox.critical(None, "Error de Instalación", f"Error al abrir el paquete:\n{str(e)}")
         return None
 
+def _ensure_app(argv=None) -> QtWidgets.QApplication:
+    """Returns the running QApplication, creating and styling it only on first use."""
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        # Must precede the QApplication: lets QIcon hand out the ratio-aware pixmaps from
+        # _build_title_icon as they are instead of scaling them again
+        QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
+        app = QtWidgets.QApplication(argv if argv is not None else sys.argv)
+        app.setStyleSheet(_GLOBAL_QSS_MIN)
+        # Room for a few full-width banner scales (the limit is in KiB)
+        QtGui.QPixmapCache.setCacheLimit(32 * 1024)
+    return app
+
+def _register_quietly(python_path: str, script_path: str):
+    try:
+        ensure_registered(python_path, script_path)
+    except Exception:
+        # The app can still run without the registration, so failures are ignored
+        pass
+
 def main(argv):
     python_path = sys.executable
     script_path = os.path.abspath(argv[0])
     
     # === REGISTRATION ===
-    # Try to register keys in HKCU (User-level) every time to ensure consistency.
-    # This does NOT require admin rights.
-    if platform.system().lower() == 'windows':
-        try:
-            # register_scheme_windows now includes clean reset (delete + create)
-            success, msg = register_scheme_windows(python_path, script_path)
-            # We don't warn if it fails silently, or maybe we should?
-            # For now, let's just ignore if it fails, as the app can still run.
-        except Exception as e:
-            pass
+    # Check the HKCU (User-level) keys every time to ensure consistency, and only rewrite them
+    # (clean reset: delete + create) when they are missing or stale. This does NOT require admin
+    # rights. When a window is opened it runs next to the window setup instead of before it; the
+    # thread is not a daemon, so a registration in progress is always finished before the process
+    # exits. Started without arguments, the keys are reset synchronously further down instead.
+    if _IS_WINDOWS and len(argv) >= 2:
+        threading.Thread(target=_register_quietly, args=(python_path, script_path),
+                         name="flarm-register").start()
 
     # === APP EXECUTION ===
-    app = QtWidgets.QApplication(argv)
-    app.setStyleSheet(GLOBAL_QSS)
+    app = _ensure_app(argv)
     
     # Parse arguments with explicit flags
     if len(argv) >= 2:
@@ -1823,7 +2816,6 @@ def main(argv):
         elif arg1 == "-l" and len(argv) >= 3:
             # Local file flag: -l "path/to/file.iflapp"
             file_path = argv[2].strip().strip('"').strip("'")
-            file_path = os.path.abspath(file_path)
             w = handle_iflapp_file(file_path)
             if not w:
                 return 1
@@ -1831,21 +2823,14 @@ def main(argv):
         else:
             # No explicit flag, try to auto-detect (backward compatibility)
             arg = arg1
-            arg_path = os.path.abspath(arg) if not arg.startswith(f"{SCHEME}:") else arg
             
-            # Priority 1: Check if it's an existing .iflapp file
-            if os.path.exists(arg_path) and arg_path.lower().endswith('.iflapp'):
-                w = handle_iflapp_file(arg_path)
-                if not w:
-                    return 1
-            
-            # Priority 2: Check if argument ends with .iflapp (even if file doesn't exist yet)
-            elif arg.lower().endswith('.iflapp'):
+            # Priority 1: .iflapp package (handle_iflapp_file resolves it and reports a missing file)
+            if os.path.splitext(arg)[1].lower() == '.iflapp':
                 w = handle_iflapp_file(arg)
                 if not w:
                     return 1
             
-            # Priority 3: Handle Fluthinstore:// protocol
+            # Priority 2: Handle Fluthinstore:// protocol
             elif arg.startswith(f"{SCHEME}:") or arg.startswith(f"{SCHEME}://"):
                 try:
                     repo, owner = parse_Fluthin_url(arg)
@@ -1869,7 +2854,16 @@ def main(argv):
                 else:
                     return 0
     else:
-        # No arguments - Just show a success message for the registration
+        # No arguments: reset the associations now and report what actually happened
+        if _IS_WINDOWS:
+            try:
+                success, msg = register_scheme_windows(python_path, script_path)
+            except Exception as e:
+                success, msg = False, str(e)
+            if not success:
+                QtWidgets.QMessageBox.warning(None, "Fluthin Handler",
+                    f"No se pudo actualizar el registro.\n\n{msg}")
+                return 1
         QtWidgets.QMessageBox.information(None, "Fluthin Handler", 
             "Registro actualizado correctamente.\n\nEl programa se ha configurado como administrador y las asociaciones se han restablecido.")
         return 0
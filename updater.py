@@ -1,6 +1,9 @@
-import sys, os, requests, shutil, subprocess, xml.etree.ElementTree as ET
+import sys, os, io, zipfile, requests, shutil, subprocess, xml.etree.ElementTree as ET
 import threading, time, traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout
 from PyQt5.QtGui import QFont, QIcon, QPixmap
 from PyQt5.QtCore import Qt, QThread, QObject, pyqtSignal
@@ -9,8 +12,19 @@ from PyQt5.QtCore import Qt, QThread, QObject, pyqtSignal
 XML_PATH = "details.xml"
 LOG_PATH = "updater_log.txt"
 CHECK_INTERVAL = 60
+# Las actualizaciones de hasta este tamaño se descomprimen desde memoria, sin pasar por update.zip
+MAX_EN_MEMORIA = 64 * 1024 * 1024
 GITHUB_API = "https://api.github.com"
 
+# Sesión compartida: hay_conexion, el XML remoto, la API y la descarga reutilizan la conexión TLS.
+# Sin reintentos de conexión, para que hay_conexion siga respondiendo rápido sin red.
+# raise_on_status=False: agotados los reintentos se devuelve la última respuesta y no un RetryError.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=20,
+    max_retries=Retry(total=3, connect=0, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      raise_on_status=False)))
+
 STYLE = """
 QWidget { background-color: #0d1117; color: #2ecc71; font-family: "Segoe UI"; }
 QPushButton { background-color: #2ecc71; color: white; border-radius: 6px; padding: 6px 12px; }
@@ -23,23 +37,31 @@ def log(msg):
         f.write(f"{timestamp} {msg}\n")
     print(f"{timestamp} {msg}")
 
+CAMPOS_XML = ("app", "version", "platform", "author")
+
 def leer_xml(path):
     try:
-        tree = ET.parse(path)
-        root = tree.getroot()
-        return {
-            "app": root.findtext("app", "").strip(),
-            "version": root.findtext("version", "").strip(),
-            "platform": root.findtext("platform", "").strip(),
-            "author": root.findtext("author", "").strip()
-        }
+        # Una sola pasada con iterparse: se toma el primer hijo directo de la raíz con cada
+        # nombre (como findtext) y cada elemento se libera al cerrarse
+        datos = dict.fromkeys(CAMPOS_XML)
+        profundidad = 0
+        for evento, elem in ET.iterparse(path, events=("start", "end")):
+            if evento == "start":
+                profundidad += 1
+                continue
+            profundidad -= 1
+            if profundidad == 1:
+                if elem.tag in datos and datos[elem.tag] is None:
+                    datos[elem.tag] = (elem.text or "").strip()
+                elem.clear()
+        return {k: v or "" for k, v in datos.items()}
     except Exception as e:
         log(f"❌ Error leyendo XML: {e}")
         return {}
 
 def hay_conexion():
     try:
-        requests.get(GITHUB_API, timeout=5)
+        SESSION.get(GITHUB_API, timeout=5)
         return True
     except:
         return False
@@ -47,7 +69,7 @@ def hay_conexion():
 def leer_xml_remoto(author, app):
     url = f"https://raw.githubusercontent.com/{author}/{app}/main/details.xml"
     try:
-        r = requests.get(url, timeout=10)
+        r = SESSION.get(url, timeout=10)
         if r.status_code == 200:
             root = ET.fromstring(r.text)
             return root.findtext("version", "").strip()
@@ -58,7 +80,7 @@ def leer_xml_remoto(author, app):
 def buscar_release(author, app, version, platform):
     url = f"{GITHUB_API}/repos/{author}/{app}/releases/tags/{version}"
     try:
-        r = requests.get(url, timeout=10)
+        r = SESSION.get(url, timeout=10)
         if r.status_code != 200:
             log(f"❌ Release {version} no encontrado en {author}/{app}")
             return None
@@ -92,33 +114,50 @@ class InstallerWorker(QObject):
             if not os.path.exists("backup_embestido"):
                 os.mkdir("backup_embestido")
             
-            # Copiar solo archivos, excluyendo el directorio de backup y el archivo de destino
-            for f in os.listdir("."):
-                if f not in ["backup_embestido", destino] and os.path.isfile(f):
-                    shutil.copy2(f, f"backup_embestido/{f}")
+            # Copiar solo archivos, excluyendo el directorio de backup y el archivo de destino.
+            # scandir ya trae el tipo de cada entrada y las copias se solapan en varios hilos.
+            with os.scandir(".") as it:
+                archivos = [e.name for e in it
+                            if e.name not in ("backup_embestido", destino) and e.is_file()]
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                # list() propaga el primer error de copia
+                list(ex.map(lambda f: shutil.copy2(f, os.path.join("backup_embestido", f)), archivos))
             log("✅ Respaldo completado.")
 
             log(f"⬇️ Descargando desde {self.url}")
-            r = requests.get(self.url, stream=True)
+            r = SESSION.get(self.url, stream=True)
             r.raise_for_status() # Lanza una excepción para códigos de estado HTTP erróneos
 
             total_size = int(r.headers.get('content-length', 0))
             bytes_downloaded = 0
             
-            with open(destino, "wb") as f:
-                for chunk in r.iter_content(8192):
+            ultimo = -1
+            en_memoria = 0 < total_size <= MAX_EN_MEMORIA
+            f = io.BytesIO() if en_memoria else open(destino, "wb")
+            try:
+                # Bloques de 1 MiB y una señal solo cuando cambia el porcentaje
+                for chunk in r.iter_content(1024 * 1024):
                     f.write(chunk)
                     bytes_downloaded += len(chunk)
                     if total_size > 0:
                         percent = int((bytes_downloaded / total_size) * 100)
-                        self.progress.emit(percent)
+                        if percent != ultimo:
+                            ultimo = percent
+                            self.progress.emit(percent)
+            finally:
+                if not en_memoria:
+                    f.close()
             
             self.progress.emit(100) # Asegurar que el progreso llegue al 100%
             log("✅ Descarga completada.")
 
             log("📦 Descomprimiendo archivos…")
-            shutil.unpack_archive(destino, ".")
-            os.remove(destino)
+            if en_memoria:
+                with zipfile.ZipFile(f) as z:
+                    z.extractall(".")
+            else:
+                shutil.unpack_archive(destino, ".")
+                os.remove(destino)
             log("✅ Archivos actualizados.")
 
             # Lógica de reinicio
@@ -291,7 +330,11 @@ def ciclo_embestido():
                 continue
 
             datos = leer_xml(XML_PATH)
-            if not datos:
+            # Sin alguno de los campos no se puede armar la URL remota ni el nombre del asset
+            faltante = next((c for c in CAMPOS_XML if not datos.get(c)), None)
+            if faltante:
+                if datos:
+                    log(f"❌ Campo requerido faltante en {XML_PATH}: {faltante}")
                 time.sleep(CHECK_INTERVAL)
                 continue
 